@@ -3,13 +3,22 @@
 """
 Build script for PDF Extractor
 PyInstaller를 사용해 실행 파일을 생성하는 스크립트
+
+PyInstaller는 PYTHONNODEBUGRANGES=1 환경에서 실행됩니다.
+(Python 3.11+ 에서 .pyc의 컬럼 위치 정보를 생략하여 번들 크기를 약 15% 줄임)
 """
 
 import os
 import sys
-import subprocess
+import argparse
+import functools
 import platform
-from pathlib import Path
+
+# subprocess, shutil, pathlib, concurrent.futures 등은 사용하는 함수 안에서 import
+# (--help, --version 실행 시 불필요한 모듈 로딩 방지)
+
+# 애플리케이션 버전
+APP_VERSION = "0.0.1"
 
 # Window CP1252 환경 stdout 인코딩 설정
 try:
@@ -17,123 +26,247 @@ try:
 except AttributeError:
     pass
 
-def get_build_command():
-    """플랫폼별 빌드 명령어 생성"""
-    system = platform.system()
-    
-    # 기본 PyInstaller 옵션
-    cmd = [
-        "pyinstaller",
-        "--onefile",
-        "--windowed",
-        "--name=pdf-extractor",
-        "--add-data=pdf_extractor.py:.",
-    ]
-    
-    # 숨겨진 import 추가
-    hidden_imports = [
-        "tkinter",
-        "tkinter.ttk",
-        "tkinter.filedialog", 
-        "tkinter.messagebox",
-        "tkinter.scrolledtext",
-        "pandas",
-        "openpyxl",
-        "pdfplumber",
-        "PyPDF2",
-        "fitz",
-        "camelot",
-        "tabula",
-        "cv2",
-        "PIL",
-        "pytesseract",
-        "easyocr",
-        "numpy"
-    ]
-    
-    for imp in hidden_imports:
-        cmd.extend(["--hidden-import", imp])
-    
-    # 제외할 모듈들 (크기 최적화)
-    excludes = [
-        "matplotlib",
-        "scipy",
-        "IPython",
-        "jupyter",
-        "notebook"
-    ]
-    
-    for exc in excludes:
-        cmd.extend(["--exclude-module", exc])
-    
-    # 플랫폼별 설정
-    if system == "Windows":
-        # 아이콘이 있다면 추가
-        if os.path.exists("icon.ico"):
-            cmd.extend(["--icon=icon.ico"])
-        # 버전 정보가 있다면 추가
-        if os.path.exists("version_info.txt"):
-            cmd.extend(["--version-file=version_info.txt"])
-    elif system == "Darwin":  # macOS
-        # 아이콘이 있다면 추가
-        if os.path.exists("icon.icns"):
-            cmd.extend(["--icon=icon.icns"])
-        cmd.extend(["--osx-bundle-identifier=com.pdfextractor.app"])
-    
-    # 메인 파일 추가
-    cmd.append("main.py")
-    
-    return cmd
-
-
-def create_spec_file():
+# 빌드 보조 데이터 캐시 위치
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf-extractor")
+
+# PyInstaller 분석 결과(모듈 그래프) 캐시 위치와 대상 파일
+PYI_GRAPH_CACHE_DIR = os.path.join(CACHE_DIR, "pyi-graph")
+PYI_GRAPH_PATTERNS = ["Analysis-*.toc", "PYZ-*.toc", "PYZ-*.pyz"]
+
+# 의존성 확인 결과 캐시 유효 시간 (초)
+DEPENDENCY_CACHE_TTL = 24 * 60 * 60
+
+# onefile 실행 시 압축 해제 위치 (실행 시점에 bootloader가 경로를 확장)
+# bootloader는 여전히 실행마다 이 폴더 아래에 _MEIxxxx를 새로 만들고 종료 시 지우므로 압축 해제 비용은 그대로.
+# 시스템 임시 폴더 대신 고정된 상위 폴더를 써서 백신 검사 예외로 지정할 수 있고, noexec로 마운트된 /tmp도 피함
+RUNTIME_TMPDIR = "%LOCALAPPDATA%\\pdf-extractor" if platform.system() == "Windows" else "~/.cache/pdf-extractor"
+
+# 기본으로 빌드할 GUI 백엔드 ("tkinter": main.py, "pyqt5": main_pyqt5.py, --gui로 변경)
+GUI_BACKEND = "tkinter"
+
+# GUI 백엔드별 진입점 / 서브모듈 전체 수집 패키지 / 제외 모듈
+# 서브모듈마다 hidden import를 두는 대신 패키지 단위로 한 번에 수집
+# 다른 GUI 툴킷이 함께 번들되지 않도록 서로를 excludes에 명시
+GUI_BACKENDS = {
+    "tkinter": {
+        "entry": "main.py",
+        "collect_submodules": [
+            "tkinter"
+        ],
+        "excludes": [
+            "PyQt5",
+            "PyQt6",
+            "PySide2",
+            "PySide6"
+        ]
+    },
+    "pyqt5": {
+        "entry": "main_pyqt5.py",
+        # 사용하지 않는 Qt 서브모듈은 아래 excludes가 우선 적용됨
+        "collect_submodules": [
+            "PyQt5"
+        ],
+        "excludes": [
+            "tkinter",
+            "PyQt6",
+            "PySide2",
+            "PySide6",
+            # 사용하지 않는 대용량 Qt 서브모듈
+            "PyQt5.QtNetwork",
+            "PyQt5.QtWebEngineCore",
+            "PyQt5.QtWebEngineWidgets"
+        ]
+    }
+}
+
+# 빌드에 필요한 패키지 (패키지명: 실제 import 이름)
+REQUIRED_PACKAGES = {
+    "tkinter": "tkinter",  # Python 기본 라이브러리
+    "pandas": "pandas",
+    "openpyxl": "openpyxl",
+    "pdfplumber": "pdfplumber",
+    "PyPDF2": "PyPDF2",
+    "PyMuPDF": "fitz",
+    "camelot-py": "camelot",
+    "tabula-py": "tabula",
+    "opencv-python": "cv2",
+    "Pillow": "PIL",
+    "pyinstaller": "PyInstaller"
+}
+
+# 선택적 패키지 (없어도 빌드 진행 가능)
+OPTIONAL_PACKAGES = {
+    "pytesseract": "pytesseract",
+    "easyocr": "easyocr"
+}
+
+# 빌드 실패 시 다시 보여줄 로그 줄 수
+ERROR_TAIL_LINES = 50
+
+# 번들 크기 회귀 검사 기준 파일 (저장소에 커밋) 및 패키지별 허용 증가율
+BUNDLE_SIZES_BASELINE = "bundle_sizes.json"
+BUNDLE_GROWTH_LIMIT = 0.10
+
+# 이전 빌드의 입력 해시 기록 파일 이름 (dist 디렉토리 안에 생성)
+BUILD_STAMP_NAME = ".build_stamp"
+
+# --targets 로 지정 가능한 빌드 대상 (이름: platform.system() 값)
+# 현재 플랫폼이 아닌 대상은 PYINSTALLER_<대상> 환경 변수로 크로스 러너 명령을 반드시 지정
+# 예) PYINSTALLER_WIN="wine pyinstaller"
+TARGET_PLATFORMS = {
+    "win": "Windows",
+    "mac": "Darwin",
+    "linux": "Linux"
+}
+
+# 번들에 함께 포함할 데이터 파일 (원본 경로, 번들 내 경로)
+DATAS = [
+    ("pdf_extractor.py", ".")
+]
+
+# 필수 hidden import 목록 (check_dependencies의 필수 패키지와 대응)
+REQUIRED_HIDDEN_IMPORTS = [
+    "pandas",
+    "openpyxl",
+    "xlsxwriter",  # pandas가 엔진 이름으로 동적 import
+    "pdfplumber",
+    "PyPDF2",
+    "fitz",
+    "camelot",
+    "tabula",
+    "cv2",
+    "PIL",
+    "numpy"
+]
+
+# UPX 압축에서 제외할 네이티브 라이브러리 (파일명 패턴)
+# 대용량 라이브러리는 실행 시 압축 해제 비용이 크고, 일부 Qt/cv2 DLL은 UPX 압축 시 충돌이 알려져 있음
+UPX_EXCLUDE = [
+    "vcruntime140.dll",
+    "python3*.dll",
+    "Qt5*.dll",
+    "cv2*.so",
+    "cv2*.pyd",
+    "libmupdf*",
+    "libtorch*",
+    "libopenblas*",
+    "libonnxruntime*",
+    "libtesseract*"
+]
+
+# 선택적 OCR 모듈 (--with-ocr 지정 시에만 포함, easyocr은 torch 등을 끌어와 번들 크기가 크게 증가)
+OCR_HIDDEN_IMPORTS = [
+    "pytesseract",
+    "easyocr"
+]
+
+# 제외할 모듈들 (크기 최적화)
+# 의존성이 끌고 오는 테스트 스위트/개발 도구까지 명시적으로 제외
+EXCLUDES = [
+    "matplotlib",
+    "scipy",
+    "IPython",
+    "jupyter",
+    "notebook",
+    "tests",
+    "test",
+    "pytest",
+    "hypothesis",
+    "pandas.tests",
+    "numpy.tests",
+    "PIL.tests",
+    "tkinter.test",
+    "setuptools._distutils",
+    "sqlalchemy",
+    "torch.test"
+]
+
+
+def _filter_installed(candidates):
+    """실제로 설치된 모듈 이름만 남김"""
+    import importlib.util
+    
+    installed = []
+    for name in candidates:
+        try:
+            if importlib.util.find_spec(name) is not None:
+                installed.append(name)
+        except (ImportError, ValueError):
+            pass
+    
+    return installed
+
+
+def get_hidden_imports(with_ocr=False):
+    """실제로 설치된 모듈만 골라 hidden import 목록 생성"""
+    candidates = list(REQUIRED_HIDDEN_IMPORTS)
+    if with_ocr:
+        candidates.extend(OCR_HIDDEN_IMPORTS)
+    
+    return _filter_installed(candidates)
+
+
+def get_collect_submodules(gui=GUI_BACKEND):
+    """서브모듈을 통째로 수집할 GUI 패키지 목록 (설치된 것만)"""
+    return _filter_installed(GUI_BACKENDS[gui]["collect_submodules"])
+
+
+def get_excludes(gui=GUI_BACKEND):
+    """번들에서 제외할 모듈 목록 생성 (크기 최적화)"""
+    return EXCLUDES + GUI_BACKENDS[gui]["excludes"]
+
+
+def create_spec_file(pack="onedir", with_ocr=False, spec_path="pdf-extractor.spec", gui=GUI_BACKEND):
     """spec 파일 생성 (고급 설정용)"""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+    hidden_imports = get_hidden_imports(with_ocr)
+    excludes = get_excludes(gui)
+    entry = GUI_BACKENDS[gui]["entry"]
+    
+    # GUI 패키지 서브모듈은 spec 평가 시점에 collect_submodules()로 펼침
+    hiddenimports_expr = "[" + ", ".join(
+        [f"*collect_submodules({package!r})" for package in get_collect_submodules(gui)]
+        + [repr(name) for name in hidden_imports]
+    ) + "]"
+    
+    # onedir은 .pyc를 PYZ 압축 아카이브 대신 개별 파일로 두어 압축 해제 없이 로드
+    # (onefile은 어차피 전체를 풀어야 하므로 아카이브 유지)
+    noarchive = pack == "onedir"
+    
+    spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 block_cipher = None
 
 a = Analysis(
-    ['main.py'],
+    [{entry!r}],
     pathex=[],
     binaries=[],
-    datas=[('pdf_extractor.py', '.')],
-    hiddenimports=[
-        'tkinter',
-        'tkinter.ttk',
-        'tkinter.filedialog',
-        'tkinter.messagebox',
-        'tkinter.scrolledtext',
-        'pandas',
-        'openpyxl',
-        'pdfplumber',
-        'PyPDF2',
-        'fitz',
-        'camelot',
-        'tabula',
-        'cv2',
-        'PIL',
-        'pytesseract',
-        'easyocr',
-        'numpy'
-    ],
+    datas={DATAS!r},
+    hiddenimports={hiddenimports_expr},
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[
-        'matplotlib',
-        'scipy',
-        'IPython',
-        'jupyter',
-        'notebook'
-    ],
+    excludes={excludes!r},
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
-    noarchive=False,
+    noarchive={noarchive!r},
 )
 
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+# 데이터 파일로 수집된 네이티브 라이브러리를 BINARY로 재분류
+# (압축 아카이브에 넣지 않고 실행 파일 옆에 그대로 두어 OS가 직접 mmap/로드)
+native_suffixes = ('.so', '.pyd', '.dylib', '.dll')
+native_datas = [entry for entry in a.datas if entry[0].lower().endswith(native_suffixes)]
+if native_datas:
+    a.datas = [entry for entry in a.datas if entry not in native_datas]
+    a.binaries = a.binaries + [(dest, src, 'BINARY') for dest, src, _ in native_datas]
 
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+'''
+    
+    # 패키징 방식별 EXE 구성 (onedir은 COLLECT로 폴더 형태 출력)
+    if pack == "onefile":
+        spec_content += f'''
 exe = EXE(
     pyz,
     a.scripts,
@@ -146,8 +279,29 @@ exe = EXE(
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx_exclude={UPX_EXCLUDE!r},
+    runtime_tmpdir={RUNTIME_TMPDIR!r},
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+target = exe
+'''
+    else:
+        spec_content += f'''
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='pdf-extractor',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -156,119 +310,557 @@ exe = EXE(
     entitlements_file=None,
 )
 
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude={UPX_EXCLUDE!r},
+    name='pdf-extractor',
+)
+target = coll
+'''
+    
+    spec_content += f'''
 # macOS용 앱 번들 생성
 import platform
 if platform.system() == 'Darwin':
     app = BUNDLE(
-        exe,
+        target,
         name='PDF Extractor.app',
         bundle_identifier='com.pdfextractor.app',
-        version='0.0.1'
+        version={APP_VERSION!r}
     )
 '''
     
-    with open('pdf-extractor.spec', 'w', encoding='utf-8') as f:
+    # 빌드 설정이 spec에 그대로 반영되었는지 확인
+    verify_spec_content(spec_content, {
+        "datas": DATAS,
+        "hiddenimports": hidden_imports,
+        "excludes": excludes
+    })
+    
+    with open(spec_path, 'w', encoding='utf-8') as f:
         f.write(spec_content)
 
 
-def build_executable():
+def verify_spec_content(spec_content, expected):
+    """생성된 spec의 Analysis(...) 인자가 빌드 설정과 일치하는지 검증"""
+    import ast
+    
+    tree = ast.parse(spec_content)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Analysis":
+            kwargs = {kw.arg: kw.value for kw in node.keywords}
+            for name, value in expected.items():
+                node_value = kwargs[name]
+                # *collect_submodules(...) 항목은 spec 평가 시점에 결정되므로 비교에서 제외
+                if isinstance(node_value, ast.List):
+                    node_value = ast.List(
+                        elts=[elt for elt in node_value.elts if not isinstance(elt, ast.Starred)],
+                        ctx=ast.Load()
+                    )
+                actual = ast.literal_eval(node_value)
+                assert actual == value, f"spec의 {name} 값이 빌드 설정과 다릅니다: {actual!r} != {value!r}"
+            return
+    
+    raise AssertionError("spec에서 Analysis(...) 호출을 찾을 수 없습니다")
+
+
+def _on_rmtree_error(func, path, exc_info):
+    """삭제 실패 시 읽기 전용 속성을 해제하고 재시도 (Windows)"""
+    import stat
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except OSError:
+        pass
+
+
+def _fast_rmtree(path):
+    """하위 디렉토리를 스레드 풀에서 병렬로 삭제한 뒤 루트 삭제"""
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if not os.path.exists(path):
+        return
+    
+    # 작은 파일 수만 개를 직렬로 unlink 하는 대기 시간을 중첩
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for entry in os.scandir(path):
+            if entry.is_dir(follow_symlinks=False):
+                executor.submit(shutil.rmtree, entry.path, onerror=_on_rmtree_error)
+    
+    # 남은 최상위 파일과 빈 루트 디렉토리 삭제
+    shutil.rmtree(path, onerror=_on_rmtree_error)
+
+
+def compute_build_hash(spec_path="pdf-extractor.spec", gui=GUI_BACKEND):
+    """빌드 입력(소스, spec, 인터프리터, 패키지 버전)의 해시 계산"""
+    import hashlib
+    from importlib import metadata
+    
+    h = hashlib.sha256()
+    
+    sources = [GUI_BACKENDS[gui]["entry"]] + [src for src, _ in DATAS] + [spec_path]
+    for path in sources:
+        h.update(path.encode())
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    
+    h.update(sys.version.encode())
+    h.update(platform.platform().encode())
+    
+    for package_name in REQUIRED_PACKAGES:
+        try:
+            version = metadata.version(package_name)
+        except metadata.PackageNotFoundError:
+            version = "-"
+        h.update(f"{package_name}=={version}".encode())
+    
+    return h.hexdigest()
+
+
+def _get_module_graph_paths(target):
+    """(PyInstaller 작업 디렉토리, 모듈 그래프 캐시 디렉토리) 반환"""
+    import hashlib
+    from importlib import metadata
+    
+    spec_path = target["spec_path"]
+    work_path = os.path.join(target["work_dir"], os.path.splitext(os.path.basename(spec_path))[0])
+    
+    # 소스, spec, 인터프리터, PyInstaller 버전이 같을 때만 재사용
+    h = hashlib.sha256()
+    for path in [GUI_BACKENDS[target["gui"]]["entry"]] + [src for src, _ in DATAS] + [spec_path]:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    h.update(sys.version.encode())
+    try:
+        h.update(metadata.version("pyinstaller").encode())
+    except metadata.PackageNotFoundError:
+        pass
+    
+    return work_path, os.path.join(PYI_GRAPH_CACHE_DIR, h.hexdigest()[:16])
+
+
+def restore_module_graph(target):
+    """캐시된 Analysis/PYZ 결과를 작업 디렉토리에 복원 (이미 있는 파일은 유지)"""
+    import glob
+    import shutil
+    
+    try:
+        work_path, cache_path = _get_module_graph_paths(target)
+        cached_files = [path for pattern in PYI_GRAPH_PATTERNS
+                        for path in glob.glob(os.path.join(cache_path, pattern))]
+        if not cached_files:
+            return False
+        
+        os.makedirs(work_path, exist_ok=True)
+        restored = 0
+        for path in cached_files:
+            dest = os.path.join(work_path, os.path.basename(path))
+            if not os.path.exists(dest):
+                shutil.copy2(path, dest)
+                restored += 1
+        if restored:
+            print(f"캐시된 모듈 그래프 {restored}개 파일을 복원했습니다: {cache_path}")
+        return True
+    except OSError as e:
+        print(f"모듈 그래프 복원 실패: {e}")
+        return False
+
+
+def save_module_graph(target):
+    """빌드 후 Analysis/PYZ 결과를 캐시에 저장"""
+    import glob
+    import shutil
+    
+    try:
+        work_path, cache_path = _get_module_graph_paths(target)
+        graph_files = [path for pattern in PYI_GRAPH_PATTERNS
+                       for path in glob.glob(os.path.join(work_path, pattern))]
+        if not graph_files:
+            return
+        
+        os.makedirs(cache_path, exist_ok=True)
+        for path in graph_files:
+            shutil.copy2(path, os.path.join(cache_path, os.path.basename(path)))
+    except OSError as e:
+        print(f"모듈 그래프 캐시 저장 실패: {e}")
+
+
+def run_streaming(cmd, env=None, tail_lines=2000, prefix=""):
+    """명령 출력을 한 줄씩 그대로 출력하고 마지막 tail_lines 줄만 보관"""
+    import subprocess
+    from collections import deque
+    
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, errors="replace", bufsize=1, env=env) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(prefix + line)
+            tail.append(line)
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output="".join(tail))
+    return tail
+
+
+def make_target(name=None, gui=GUI_BACKEND):
+    """빌드 대상 정보 생성 (name이 없으면 현재 플랫폼을 기본 경로에 빌드, gui: GUI_BACKENDS 키)"""
+    if name is None:
+        return {
+            "name": None,
+            "gui": gui,
+            "platform": platform.system(),
+            "spec_path": "pdf-extractor.spec",
+            "dist_dir": "dist",
+            "work_dir": "build",
+            "pyinstaller": ["pyinstaller"]
+        }
+    
+    env_name = f"PYINSTALLER_{name.upper()}"
+    pyinstaller = os.environ.get(env_name)
+    if not pyinstaller:
+        # 호스트의 pyinstaller로는 다른 플랫폼용 실행 파일을 만들 수 없음
+        if TARGET_PLATFORMS[name] != platform.system():
+            raise ValueError(f"'{name}' 대상을 빌드하려면 {env_name} 환경 변수로 PyInstaller 실행 명령을 지정하세요")
+        pyinstaller = "pyinstaller"
+    return {
+        "name": name,
+        "gui": gui,
+        "platform": TARGET_PLATFORMS[name],
+        "spec_path": f"pdf-extractor-{name}.spec",
+        "dist_dir": os.path.join("dist", name),
+        "work_dir": os.path.join("build", name),
+        "pyinstaller": pyinstaller.split()
+    }
+
+
+def build_executable(pack="onedir", force=False, with_ocr=False, target=None):
     """실행 파일 빌드"""
-    print("PDF Extractor 빌드를 시작합니다...")
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
     
-    # 빌드 디렉토리 정리
-    if os.path.exists("build"):
-        import shutil
-        shutil.rmtree("build")
-    if os.path.exists("dist"):
-        import shutil
-        shutil.rmtree("dist")
+    if target is None:
+        target = make_target()
+    prefix = f"[{target['name']}] " if target["name"] else ""
+    dist_dir = target["dist_dir"]
+    spec_path = target["spec_path"]
+    
+    print(f"{prefix}PDF Extractor 빌드를 시작합니다...")
+    
+    # 빌드 디렉토리 정리 (--force 지정 시에만)
+    # build/ 를 유지하면 PyInstaller가 이전 분석 결과를 재사용하여 증분 빌드가 가능
+    if force:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(_fast_rmtree, [target["work_dir"], dist_dir]))
     
     # spec 파일 생성
-    create_spec_file()
+    create_spec_file(pack, with_ocr, spec_path, target["gui"])
+    
+    # 입력이 이전 빌드와 동일하면 PyInstaller 실행 생략
+    build_stamp = os.path.join(dist_dir, BUILD_STAMP_NAME)
+    build_hash = compute_build_hash(spec_path, target["gui"])
+    if not force and os.path.exists(get_executable_path(pack, dist_dir, target["platform"])):
+        try:
+            with open(build_stamp, 'r', encoding='utf-8') as f:
+                if f.read().strip() == build_hash:
+                    print(f"{prefix}up-to-date: 입력 파일이 변경되지 않아 빌드를 건너뜁니다. (--force로 강제 빌드)")
+                    return True
+        except OSError:
+            pass
     
     try:
-        # PyInstaller 실행
-        system = platform.system()
+        # PyInstaller 실행 (위에서 생성한 spec 파일 사용)
+        cmd = target["pyinstaller"] + ["--noconfirm", spec_path]
+        if force:
+            cmd.insert(len(target["pyinstaller"]), "--clean")
         
-        if os.path.exists("pdf-extractor.spec"):
-            # spec 파일 사용
-            cmd = ["pyinstaller", "--clean", "pdf-extractor.spec"]
-        else:
-            # 명령행 옵션 사용
-            cmd = get_build_command()
+        # 대상별 출력/작업 디렉토리 분리
+        cmd[len(target["pyinstaller"]):len(target["pyinstaller"])] = [
+            "--distpath", dist_dir, "--workpath", target["work_dir"]
+        ]
+        
+        print(f"{prefix}실행 명령어: {' '.join(cmd)}")
+        
+        # 작업 디렉토리가 비어 있으면(새 체크아웃, CI 등) 이전 분석 결과를 가져와 Analysis 단계 단축
+        if not force:
+            restore_module_graph(target)
         
-        print(f"실행 명령어: {' '.join(cmd)}")
+        # .pyc 크기 축소 (열 위치 정보 제외)
+        env = {**os.environ, "PYTHONNODEBUGRANGES": "1"}
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # 출력을 실시간으로 표시 (전체 로그를 메모리에 쌓지 않음)
+        run_streaming(cmd, env=env, prefix=prefix)
         
-        print("빌드 성공!")
-        print(f"출력 결과:\n{result.stdout}")
+        print(f"{prefix}빌드 성공!")
+        
+        with open(build_stamp, 'w', encoding='utf-8') as f:
+            f.write(build_hash)
+        save_module_graph(target)
         
         # 생성된 파일 확인
-        dist_path = Path("dist")
+        from pathlib import Path
+        dist_path = Path(dist_dir)
         if dist_path.exists():
             files = list(dist_path.iterdir())
-            print(f"\n생성된 파일들:")
+            print(f"\n{prefix}생성된 파일들:")
             for file in files:
                 print(f"  - {file}")
                 
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"빌드 실패: {e}")
-        print(f"에러 출력:\n{e.stderr}")
+        print(f"{prefix}빌드 실패: {e}")
+        error_tail = e.output.splitlines()[-ERROR_TAIL_LINES:]
+        print(f"{prefix}에러 출력 (마지막 {len(error_tail)}줄):")
+        print("\n".join(error_tail))
         return False
     except Exception as e:
-        print(f"예상치 못한 오류: {e}")
+        print(f"{prefix}예상치 못한 오류: {e}")
         return False
 
 
-def check_dependencies():
-    """필요한 의존성 확인"""
-    print("의존성 확인 중...")
+def build_targets(targets, pack="onedir", force=False, with_ocr=False):
+    """여러 대상을 프로세스 풀에서 동시에 빌드 (대상별 dist/<대상>, build/<대상> 사용)"""
+    build = functools.partial(build_executable, pack, force, with_ocr)
     
-    # 패키지명과 실제 import 이름 매핑
-    required_packages = {
-        "tkinter": "tkinter",  # Python 기본 라이브러리
-        "pandas": "pandas", 
-        "openpyxl": "openpyxl",
-        "pdfplumber": "pdfplumber",
-        "PyPDF2": "PyPDF2",
-        "PyMuPDF": "fitz",
-        "camelot-py": "camelot",
-        "tabula-py": "tabula",
-        "opencv-python": "cv2",
-        "Pillow": "PIL",
-        "pyinstaller": "PyInstaller"
-    }
+    if len(targets) <= 1:
+        return all([build(target) for target in targets])
     
-    # 선택적 패키지 (없어도 빌드 진행 가능)
-    optional_packages = {
-        "pytesseract": "pytesseract",
-        "easyocr": "easyocr"
-    }
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=len(targets)) as executor:
+        results = list(executor.map(build, targets))
+    return all(results)
+
+
+def get_executable_path(pack="onedir", dist_dir="dist", system=None):
+    """빌드된 실행 파일 경로 반환"""
+    system = system or platform.system()
+    exe_name = "pdf-extractor.exe" if system == "Windows" else "pdf-extractor"
+    if pack == "onedir":
+        return os.path.join(dist_dir, "pdf-extractor", exe_name)
+    return os.path.join(dist_dir, exe_name)
+
+
+def get_bundle_sizes(exe_path):
+    """번들 내용을 최상위 패키지별 크기(bytes)로 집계"""
+    import re
+    import subprocess
+    from collections import Counter
+    
+    sizes = Counter()
+    
+    # 실행 파일 내부 아카이브 (PKG + PYZ) 목록
+    cmd = [sys.executable, "-m", "PyInstaller.utils.cliutils.archive_viewer",
+           "--list", "--recursive", exe_path]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    
+    columns = []
+    for line in result.stdout.splitlines():
+        fields = [field.strip().strip("'\"") for field in line.split(",")]
+        if "name" in fields and "length" in fields:
+            # 아카이브별 헤더 행 (컬럼 순서는 아카이브 종류마다 다름)
+            columns = fields
+            continue
+        if not columns or len(fields) != len(columns):
+            continue
+        row = dict(zip(columns, fields))
+        try:
+            length = int(row.get("uncompressed_length", row["length"]))
+        except ValueError:
+            continue
+        package = re.split(r"[./\\]", row["name"])[0] or row["name"]
+        sizes[package] += length
+    
+    # onedir 빌드는 네이티브 라이브러리가 실행 파일 옆에 풀려 있음
+    bundle_dir = os.path.dirname(exe_path)
+    if os.path.basename(bundle_dir) == "pdf-extractor":
+        for root, _, files in os.walk(bundle_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if path == exe_path:
+                    continue
+                rel_path = os.path.relpath(path, bundle_dir)
+                parts = [part for part in re.split(r"[/\\]", rel_path) if part != "_internal"]
+                package = parts[0].split(".")[0] if parts else rel_path
+                sizes[package] += os.path.getsize(path)
+    
+    return sizes
+
+
+def analyze_bundle(exe_path, top=30):
+    """번들에서 가장 큰 패키지 목록 출력 (excludes 조정용), 집계 결과 반환"""
+    import subprocess
+    
+    if not os.path.exists(exe_path):
+        print(f"실행 파일을 찾을 수 없습니다: {exe_path}")
+        return None
+    
+    try:
+        sizes = get_bundle_sizes(exe_path)
+    except subprocess.CalledProcessError as e:
+        print(f"번들 분석 실패: {e}")
+        print(f"에러 출력:\n{e.stderr}")
+        return None
+    
+    total = sum(sizes.values())
+    print(f"\n=== 번들 크기 분석 (상위 {top}개) ===")
+    for package, size in sizes.most_common(top):
+        percent = size / total * 100 if total else 0
+        print(f"  {size / 1024 / 1024:8.2f}MB  {percent:5.1f}%  {package}")
+    print(f"  {total / 1024 / 1024:8.2f}MB  합계")
+    return sizes
+
+
+def check_bundle_growth(sizes, top, baseline_path=BUNDLE_SIZES_BASELINE):
+    """상위 패키지 크기를 기준 파일과 비교해 허용치 이상 커진 패키지가 있으면 실패"""
+    import json
+    
+    if not os.path.exists(baseline_path):
+        print(f"기준 파일이 없습니다: {baseline_path} (--update-baseline 으로 생성)")
+        return False
+    
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    
+    grown = []
+    for package, size in sizes.most_common(top):
+        base_size = baseline.get(package)
+        if base_size and size > base_size * (1 + BUNDLE_GROWTH_LIMIT):
+            grown.append((package, base_size, size))
+    
+    if grown:
+        print(f"\n❌ 기준 대비 {BUNDLE_GROWTH_LIMIT:.0%} 넘게 커진 패키지:")
+        for package, base_size, size in grown:
+            print(f"  {package}: {base_size / 1024 / 1024:.2f}MB → {size / 1024 / 1024:.2f}MB "
+                  f"(+{(size / base_size - 1) * 100:.1f}%)")
+        return False
+    
+    print(f"✓ 상위 {top}개 패키지 모두 기준 대비 {BUNDLE_GROWTH_LIMIT:.0%} 이내")
+    return True
+
+
+def save_bundle_baseline(sizes, top, baseline_path=BUNDLE_SIZES_BASELINE):
+    """상위 패키지 크기를 기준 파일로 저장"""
+    import json
+    
+    baseline = dict(sizes.most_common(top))
+    with open(baseline_path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"✓ 번들 크기 기준 저장: {baseline_path}")
+
+
+def _probe(package_name, import_name):
+    """패키지 import 가능 여부 확인
+    
+    스레드 풀에서 동시에 import하므로 ImportError 외의 예외(import 락 교착 감지, 확장 모듈 로딩 오류 등)도
+    모두 누락으로 처리
+    """
+    try:
+        __import__(import_name)
+        return package_name, True
+    except ImportError:
+        return package_name, False
+    except Exception as e:
+        print(f"⚠ {package_name} import 중 오류: {type(e).__name__}: {e}")
+        return package_name, False
+
+
+def _get_dependency_cache_path():
+    """인터프리터와 site-packages 상태에 대응하는 의존성 캐시 파일 경로"""
+    import hashlib
+    import sysconfig
+    
+    purelib = sysconfig.get_paths()["purelib"]
+    key_source = sys.executable + str(os.path.getmtime(purelib))
+    key = hashlib.sha1(key_source.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"deps-{key}.json")
+
+
+def _load_dependency_cache(cache_path):
+    """유효한 의존성 캐시가 있으면 반환"""
+    import json
+    import time
+    
+    try:
+        if time.time() - os.path.getmtime(cache_path) < DEPENDENCY_CACHE_TTL:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_dependency_cache(cache_path, payload):
+    """의존성 확인 결과를 캐시에 원자적으로 저장"""
+    import json
+    
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"의존성 캐시 저장 실패: {e}")
+
+
+def check_dependencies(use_cache=True):
+    """필요한 의존성 확인"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    print("의존성 확인 중...")
     
     missing_required = []
     missing_optional = []
+    all_packages = {**REQUIRED_PACKAGES, **OPTIONAL_PACKAGES}
+    
+    # 인터프리터와 site-packages가 그대로라면 이전 확인 결과 재사용
+    cache_path = _get_dependency_cache_path()
+    cached = _load_dependency_cache(cache_path) if use_cache else None
+    
+    if cached is not None:
+        print("(캐시된 의존성 확인 결과 사용, --no-cache로 재확인)")
+        missing = set(cached["missing_required"]) | set(cached["missing_optional"])
+        installed = {package_name: package_name not in missing for package_name in all_packages}
+    else:
+        # import 확인을 스레드 풀에서 동시에 수행 (확장 모듈 로딩 대기 시간 중첩)
+        max_workers = min(8, len(all_packages))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_probe, package_name, import_name)
+                for package_name, import_name in all_packages.items()
+            ]
+            installed = dict(future.result() for future in as_completed(futures))
     
     # 필수 패키지 확인
-    for package_name, import_name in required_packages.items():
-        try:
-            __import__(import_name)
+    for package_name in REQUIRED_PACKAGES:
+        if installed[package_name]:
             print(f"✓ {package_name} 설치됨")
-        except ImportError:
+        else:
             print(f"✗ {package_name} 누락")
             missing_required.append(package_name)
     
     # 선택적 패키지 확인
-    for package_name, import_name in optional_packages.items():
-        try:
-            __import__(import_name)
+    for package_name in OPTIONAL_PACKAGES:
+        if installed[package_name]:
             print(f"✓ {package_name} 설치됨 (선택사항)")
-        except ImportError:
+        else:
             print(f"⚠ {package_name} 누락 (선택사항)")
             missing_optional.append(package_name)
     
+    if cached is None:
+        _save_dependency_cache(cache_path, {
+            "missing_required": missing_required,
+            "missing_optional": missing_optional
+        })
+    
     if missing_required:
         print(f"\n필수 패키지 누락: {missing_required}")
         print("다음 명령어로 설치하세요:")
@@ -283,24 +875,136 @@ def check_dependencies():
     return True
 
 
+def parse_targets(value):
+    """--targets 값을 대상 이름 목록으로 변환"""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TARGET_PLATFORMS]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(f"알 수 없는 빌드 대상: {', '.join(unknown) or value}")
+    return names
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="PDF Extractor 빌드 스크립트")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["build", "analyze"],
+        default="build",
+        help="build: 실행 파일 빌드 (기본값), analyze: 빌드된 번들의 패키지별 크기 분석"
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"PDF Extractor {APP_VERSION}"
+    )
+    parser.add_argument(
+        "--pack",
+        choices=["onedir", "onefile"],
+        default="onedir",
+        help="패키징 방식 (onedir: 빠른 실행, onefile: 단일 실행 파일)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="build/, dist/ 를 삭제하고 캐시 없이 전체 재빌드 (릴리즈용)"
+    )
+    parser.add_argument(
+        "--gui",
+        choices=list(GUI_BACKENDS),
+        default=GUI_BACKEND,
+        help=f"번들할 GUI (tkinter: main.py, pyqt5: main_pyqt5.py, 기본값 {GUI_BACKEND})"
+    )
+    parser.add_argument(
+        "--with-ocr",
+        action="store_true",
+        help="OCR 모듈(pytesseract, easyocr)을 hidden import로 포함"
+    )
+    parser.add_argument(
+        "--analyze-size",
+        action="store_true",
+        help="빌드 후 번들에서 가장 큰 패키지 상위 30개 출력"
+    )
+    parser.add_argument(
+        "--largest-modules",
+        type=int,
+        metavar="N",
+        help=f"analyze: 상위 N개 패키지를 {BUNDLE_SIZES_BASELINE} 기준과 비교해 "
+             f"{BUNDLE_GROWTH_LIMIT * 100:.0f}%% 넘게 커졌으면 실패 (CI 크기 회귀 검사)"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"analyze: 분석 결과를 {BUNDLE_SIZES_BASELINE} 기준으로 저장"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="캐시된 의존성 확인 결과를 무시하고 다시 확인"
+    )
+    parser.add_argument(
+        "--targets",
+        type=parse_targets,
+        help=f"쉼표로 구분한 빌드 대상 ({','.join(TARGET_PLATFORMS)}), dist/<대상>/ 에 동시 빌드"
+    )
+    return parser.parse_args()
+
+
+def run_analyze(args):
+    """analyze 명령: 빌드된 번들 크기 분석 및 기준 대비 회귀 검사"""
+    exe_path = get_executable_path(args.pack)
+    top = args.largest_modules or 30
+    
+    sizes = analyze_bundle(exe_path, top=top)
+    if sizes is None:
+        return False
+    
+    if args.update_baseline:
+        save_bundle_baseline(sizes, top)
+        return True
+    if args.largest_modules:
+        return check_bundle_growth(sizes, top)
+    return True
+
+
 def main():
     """메인 함수"""
+    args = parse_args()
+    
+    if args.command == "analyze":
+        if not run_analyze(args):
+            sys.exit(1)
+        return
+    
     print("=== PDF Extractor 빌드 스크립트 ===")
     print(f"플랫폼: {platform.system()} {platform.machine()}")
     print(f"Python 버전: {sys.version}")
     
     # 의존성 확인
-    if not check_dependencies():
+    if not check_dependencies(use_cache=not args.no_cache):
         print("의존성 문제로 빌드를 중단합니다.")
         sys.exit(1)
     
     # 빌드 실행
-    success = build_executable()
+    if args.targets:
+        try:
+            targets = [make_target(name, args.gui) for name in args.targets]
+        except ValueError as e:
+            print(f"빌드 대상 오류: {e}")
+            sys.exit(1)
+        success = build_targets(targets, args.pack, args.force, args.with_ocr)
+    else:
+        targets = [make_target(gui=args.gui)]
+        success = build_executable(args.pack, args.force, args.with_ocr, targets[0])
     
     if success:
-        print("\n🎉 Tkinter 기반 PDF Extractor 빌드가 성공적으로 완료되었습니다!")
+        print(f"\n🎉 {'PyQt5' if args.gui == 'pyqt5' else 'Tkinter'} 기반 PDF Extractor 빌드가 성공적으로 완료되었습니다!")
         print("📁 dist/ 폴더에서 실행 파일을 확인하세요.")
-        print("🚀 PyQt5 의존성 문제가 해결되어 안정적인 빌드가 가능합니다.")
+        
+        if args.analyze_size:
+            for target in targets:
+                analyze_bundle(get_executable_path(args.pack, target["dist_dir"], target["platform"]))
     else:
         print("\n❌ 빌드에 실패했습니다.")
         sys.exit(1)
@@ -8,136 +8,291 @@ PDF 파일에서 데이터를 추출하여 Excel 파일로 저장하는 GUI 애
 import sys
 import os
 import traceback
+import io
 import json
 import time
-import threading
+import multiprocessing
+import queue
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from tkinter.ttk import Progressbar, Notebook
 
-from pdf_extractor import PDFExtractor
+# 설정 파일 직렬화 (orjson이 있으면 사용, 없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-class ExtractorThread(threading.Thread):
-    """PDF 추출 작업을 백그라운드에서 수행하는 스레드"""
+# GUI 추출 방법 → PDFExtractor 추출 방법
+EXTRACTION_METHODS = {
+    'auto': '자동 선택',
+    'text': 'pymupdf',
+    'table': 'pdfplumber'
+}
+
+# 추출 프로세스 메시지 종류 → PDFExtractorGUI 처리 메서드 ("page", "log", "finished"는 drain_queue에서 직접 처리)
+QUEUE_HANDLERS = {
+    'status': 'update_status',
+    'current_file': 'update_current_file',
+    'progress': 'update_progress',
+    'file_progress': 'update_file_progress',
+    'details': 'update_progress_details',
+    'stats': 'update_stats_text'
+}
+
+# 설정 변경 후 저장까지 기다리는 시간 (ms, 연속 변경은 한 번만 저장)
+SETTINGS_SAVE_DELAY = 500
+
+# 로그 창에 유지할 최대 줄 수 (초과분은 앞에서부터 삭제)
+LOG_MAX_LINES = 5000
+
+# 추출 프로세스 → GUI 메시지 큐 폴링 간격 (ms)
+QUEUE_POLL_INTERVAL = 50
+
+# 작업 프로세스의 페이지 진행률 보고용 큐와 추출기 (_init_worker 에서 설정)
+_progress_queue = None
+_EXTRACTOR = None
+
+# 로그 타임스탬프 캐시 (초 단위, 포맷된 문자열)
+_ts_cache = (0, "")
+
+
+def log_timestamp() -> str:
+    """로그용 "%H:%M:%S" 타임스탬프 (같은 초 안에서는 strftime 재사용)"""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
+def get_worker_count(file_count: int) -> int:
+    """사용 가능한 CPU 수 기준 작업 프로세스 수 (컨테이너의 CPU affinity 반영)"""
+    if hasattr(os, 'process_cpu_count'):
+        cpus = os.process_cpu_count()
+    elif hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count()
+    return max(1, min(cpus or 1, file_count))
+
+
+def _init_worker(progress_queue):
+    """작업 프로세스 초기화 (추출기는 프로세스당 한 번만 생성해 모든 파일에 재사용)"""
+    global _progress_queue, _EXTRACTOR
+    from pdf_extractor import PDFExtractor
     
-    def __init__(self, pdf_files: List[str], output_dir: str, options: dict, callback_manager):
-        super().__init__()
-        self.pdf_files = pdf_files
-        self.output_dir = output_dir
-        self.options = options
-        self.callback_manager = callback_manager
-        self.extractor = PDFExtractor()
-        self.daemon = True  # 메인 프로그램 종료시 함께 종료
-        
-    def run(self):
+    _progress_queue = progress_queue
+    _EXTRACTOR = PDFExtractor()
+
+
+def _prefetch_file(pdf_file: str):
+    """파일 전체를 OS 페이지 캐시로 미리 읽도록 요청 (posix_fadvise 미지원 플랫폼은 무시)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(pdf_file, os.O_RDONLY)
         try:
-            start_time = time.time()
-            
-            total_files = len(self.pdf_files)
-            self.callback_manager.status_update("추출 작업 시작...")
-            self.callback_manager.log_message(f"📁 총 {total_files}개 파일 처리 시작")
-            
-            for i, pdf_file in enumerate(self.pdf_files):
-                filename = os.path.basename(pdf_file)
-                self.callback_manager.current_file_update(f"현재 파일: {filename}")
-                
-                try:
-                    file_size = os.path.getsize(pdf_file) / (1024 * 1024)  # MB
-                    size_info = f"({file_size:.1f}MB)" if file_size > 1 else f"({file_size*1024:.0f}KB)"
-                    self.callback_manager.log_message(f"📄 처리 시작: {filename} {size_info}")
-                    
-                    if file_size > 50:
-                        self.callback_manager.status_update(f"대용량 파일 처리 중...")
-                        self.callback_manager.log_message(f"⚠️  대용량 파일 감지: {file_size:.1f}MB")
-                    else:
-                        self.callback_manager.status_update(f"파일 처리 중...")
-                        
-                except Exception as e:
-                    self.callback_manager.log_message(f"파일 크기 확인 실패: {str(e)}")
-                
-                # PDF 처리
-                try:
-                    output_excel = os.path.join(
-                        self.output_dir, 
-                        f"{os.path.splitext(filename)[0]}_extracted.xlsx"
-                    )
-                    
-                    self.callback_manager.file_progress_update(0)
-                    
-                    # PDF에서 텍스트와 테이블 추출
-                    def progress_callback(current_page, total_pages):
-                        progress = int((current_page / total_pages) * 100)
-                        self.callback_manager.file_progress_update(progress)
-                        self.callback_manager.progress_details_update(f"페이지 {current_page}/{total_pages}")
-                    
-                    self.extractor.extract_pdf(
-                        pdf_file, 
-                        output_excel, 
-                        progress_callback=progress_callback,
-                        **self.options
-                    )
-                    
-                    self.callback_manager.file_progress_update(100)
-                    self.callback_manager.log_message(f"✅ 완료: {filename}")
-                    
-                except Exception as e:
-                    error_msg = f"❌ 실패: {filename} - {str(e)}"
-                    self.callback_manager.log_message(error_msg)
-                    print(f"처리 오류: {str(e)}")
-                    traceback.print_exc()
-                
-                # 전체 진행률 업데이트
-                overall_progress = int(((i + 1) / total_files) * 100)
-                self.callback_manager.progress_update(overall_progress)
-                
-                elapsed_time = time.time() - start_time
-                self.callback_manager.processing_stats_update(i + 1, total_files, elapsed_time)
-            
-            # 완료
-            elapsed_time = time.time() - start_time
-            self.callback_manager.status_update("모든 작업 완료!")
-            self.callback_manager.log_message(f"🎉 추출 완료! 총 소요시간: {elapsed_time:.1f}초")
-            self.callback_manager.finished(True, "추출이 완료되었습니다.")
-            
-        except Exception as e:
-            error_msg = f"추출 중 오류 발생: {str(e)}"
-            self.callback_manager.log_message(f"❌ {error_msg}")
-            traceback.print_exc()
-            self.callback_manager.finished(False, error_msg)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _read_ahead(pdf_file: str, chunk_size: int = 1024 * 1024):
+    """다음 차례 파일을 페이지 캐시에 올려 둠 (posix_fadvise 미지원 시 직접 읽어서 버림)"""
+    if hasattr(os, 'posix_fadvise'):
+        _prefetch_file(pdf_file)
+        return
+    try:
+        with open(pdf_file, 'rb') as f:
+            while f.read(chunk_size):
+                pass
+    except OSError:
+        pass
+
+
+def _extract_one(pdf_file: str, output_dir: str, options: dict):
+    """작업 프로세스에서 PDF 1개 추출 → (파일명, 성공 여부, 오류 메시지)
+    
+    Excel 파일은 작업 프로세스에서 바로 저장하고 작은 상태 튜플만 돌려주므로
+    추출한 DataFrame이 프로세스 간에 pickle로 오가지 않음
+    """
+    filename = Path(pdf_file).name
+    # 추출 라이브러리들이 같은 파일을 여러 번 열어 읽으므로 디스크 읽기를 미리 시작
+    _prefetch_file(pdf_file)
+    try:
+        extractor = _EXTRACTOR
+        
+        # extract_data_batch는 페이지 배치가 끝날 때마다 한 번 호출하므로 보통 배치마다 전송되고,
+        # 마지막 전송 이후 퍼센트가 그대로이면서 50ms가 지나지 않은 호출(짧은 배치가 연달아 끝날 때)만 생략
+        last_pct = [-1]
+        last_t = [0.0]
+        
+        def progress_callback(current_page, total_pages):
+            pct = current_page * 100 // total_pages
+            now = time.monotonic()
+            if pct != last_pct[0] or now - last_t[0] > 0.05:
+                _progress_queue.put(("page", filename, current_page, total_pages))
+                last_pct[0] = pct
+                last_t[0] = now
+        
+        extract_options = dict(options, method=EXTRACTION_METHODS.get(options.get('method'), options.get('method')))
+        ok = extractor.extract_to_excel(pdf_file, output_dir, extract_options, progress_callback=progress_callback)
+        return filename, ok, None if ok else "추출된 데이터가 없거나 추출에 실패했습니다."
+    except Exception as e:
+        traceback.print_exc()
+        return filename, False, str(e)
+
+
+def format_processing_stats(processed: int, total: int, elapsed: float) -> str:
+    """처리 통계 표시 문구 생성"""
+    remaining = total - processed
+    if processed > 0:
+        avg_time = elapsed / processed
+        estimated_remaining = avg_time * remaining
+        return (f"진행: {processed}/{total}개 파일 "
+                f"| 경과: {elapsed:.1f}초 "
+                f"| 예상 남은 시간: {estimated_remaining:.1f}초")
+    return f"진행: {processed}/{total}개 파일 | 경과: {elapsed:.1f}초"
 
 
 class CallbackManager:
-    """스레드와 GUI 간 콜백 관리"""
+    """추출 프로세스에서 GUI로 보낼 메시지를 큐에 기록 (GUI는 drain_queue로 처리)"""
     
-    def __init__(self, main_window):
-        self.main_window = main_window
+    def __init__(self, message_queue):
+        self.queue = message_queue
     
     def status_update(self, message):
-        self.main_window.after(0, self.main_window.update_status, message)
+        self.queue.put(("status", message))
     
     def log_message(self, message):
-        self.main_window.after(0, self.main_window.add_log_message, message)
+        self.queue.put(("log", log_timestamp(), message))
     
     def current_file_update(self, message):
-        self.main_window.after(0, self.main_window.update_current_file, message)
+        self.queue.put(("current_file", message))
     
     def progress_update(self, value):
-        self.main_window.after(0, self.main_window.update_progress, value)
+        self.queue.put(("progress", value))
     
     def file_progress_update(self, value):
-        self.main_window.after(0, self.main_window.update_file_progress, value)
+        self.queue.put(("file_progress", value))
     
     def progress_details_update(self, message):
-        self.main_window.after(0, self.main_window.update_progress_details, message)
+        self.queue.put(("details", message))
     
     def processing_stats_update(self, processed, total, elapsed):
-        self.main_window.after(0, self.main_window.update_processing_stats, processed, total, elapsed)
+        # 숫자 계산과 문자열 포맷은 추출 프로세스에서 끝내고 완성된 문구만 전달
+        if total > 0:
+            self.queue.put(("stats", format_processing_stats(processed, total, elapsed)))
     
     def finished(self, success, message):
-        self.main_window.after(0, self.main_window.extraction_finished, success, message)
+        self.queue.put(("finished", success, message))
+
+
+def extractor_worker(pdf_files: List[str], pdf_names: List[str], pdf_sizes: List[Optional[int]],
+                     output_dir: str, options: dict, message_queue):
+    """별도 프로세스에서 PDF 추출 작업을 프로세스 풀에 분배하고 결과를 모음
+    
+    GUI 프로세스와 GIL을 공유하지 않으므로 추출 중에도 Tk 메인 루프가 멈추지 않음
+    """
+    callback_manager = CallbackManager(message_queue)
+    try:
+        start_time = time.time()
+        
+        total_files = len(pdf_files)
+        workers = get_worker_count(total_files)
+        callback_manager.status_update("추출 작업 시작...")
+        callback_manager.log_message(f"📁 총 {total_files}개 파일 처리 시작 (작업 프로세스 {workers}개)")
+        
+        # 파일명과 크기는 선택 시점에 한 번만 계산해 둔 값을 사용
+        for filename, size in zip(pdf_names, pdf_sizes):
+            if size is None:
+                callback_manager.log_message(f"파일 크기 확인 실패: {filename}")
+                continue
+            
+            file_size = size / (1024 * 1024)  # MB
+            size_info = f"({file_size:.1f}MB)" if file_size > 1 else f"({file_size*1024:.0f}KB)"
+            callback_manager.log_message(f"📄 처리 대기: {filename} {size_info}")
+            
+            if file_size > 50:
+                callback_manager.log_message(f"⚠️  대용량 파일 감지: {file_size:.1f}MB")
+        
+        callback_manager.status_update("파일 처리 중...")
+        callback_manager.file_progress_update(0)
+        
+        # GUI 시작 시에는 불러오지 않은 추출 모듈을 여기서 한 번 불러 둠
+        # (fork 방식이면 작업 프로세스들이 그대로 물려받음)
+        import pdf_extractor
+        pdf_extractor.check_preloaded_allocator()
+        
+        # 작업 프로세스가 파싱하는 동안 다음 차례 파일을 읽어 두는 읽기 전용 스레드 (더블 버퍼)
+        with ThreadPoolExecutor(max_workers=1) as reader, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(message_queue,)) as executor:
+            futures = [
+                executor.submit(_extract_one, pdf_file, output_dir, options)
+                for pdf_file in pdf_files
+            ]
+            if workers < total_files:
+                reader.submit(_read_ahead, pdf_files[workers])
+            
+            for done, future in enumerate(as_completed(futures), start=1):
+                # 방금 빈 작업 프로세스가 집어갈 파일의 다음 파일을 미리 읽기
+                if workers + done < total_files:
+                    reader.submit(_read_ahead, pdf_files[workers + done])
+                
+                filename, ok, err = future.result()
+                if ok:
+                    callback_manager.log_message(f"✅ 완료: {filename}")
+                else:
+                    callback_manager.log_message(f"❌ 실패: {filename} - {err}")
+                
+                callback_manager.current_file_update(f"완료된 파일: {filename}")
+                callback_manager.file_progress_update(100)
+                
+                # 전체 진행률 업데이트
+                overall_progress = int((done / total_files) * 100)
+                callback_manager.progress_update(overall_progress)
+                
+                elapsed_time = time.time() - start_time
+                callback_manager.processing_stats_update(done, total_files, elapsed_time)
+        
+        # 완료
+        elapsed_time = time.time() - start_time
+        callback_manager.status_update("모든 작업 완료!")
+        callback_manager.log_message(f"🎉 추출 완료! 총 소요시간: {elapsed_time:.1f}초")
+        callback_manager.finished(True, "추출이 완료되었습니다.")
+        
+    except Exception as e:
+        error_msg = f"추출 중 오류 발생: {str(e)}"
+        callback_manager.log_message(f"❌ {error_msg}")
+        traceback.print_exc()
+        callback_manager.finished(False, error_msg)
+
+
+def _terminate_process_tree(process):
+    """추출 프로세스와 그 작업 프로세스들을 함께 종료"""
+    import psutil
+    
+    try:
+        children = psutil.Process(process.pid).children(recursive=True)
+    except psutil.NoSuchProcess:
+        children = []
+    for child in children:
+        try:
+            child.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    process.terminate()
+    process.join(timeout=5)
 
 
 class PDFExtractorGUI:
@@ -150,18 +305,33 @@ class PDFExtractorGUI:
         self.root.resizable(True, True)
         
         # 변수들 초기화
+        # 선택된 PDF 목록 (경로 / 파일명 / 크기를 같은 순서의 리스트로 보관)
         self.pdf_files = []
+        self.pdf_names = []
+        self.pdf_sizes = []
         self.output_dir = ""
-        self.extractor_thread = None
+        self.extractor_process = None
+        self.message_queue = None
         self.start_time = 0
         
+        # 로그 버퍼 (after_idle 시점에 모아서 한 번에 insert)
+        self._log_buf = deque()
+        self._log_pending = False
+        self._log_lines = 0
+        
         # 설정 파일 경로
         self.settings_file = Path("settings.json")
         self.settings = self.load_settings()
         
+        self._settings_save_job = None
+        
         self.setup_gui()
         self.load_window_settings()
         
+        # 옵션이 바뀔 때마다 설정 저장 예약 (로드 이후에 연결해야 초기값 설정으로 저장되지 않음)
+        self.method_var.trace_add("write", lambda *_: self._save_settings_debounced())
+        self.ocr_var.trace_add("write", lambda *_: self._save_settings_debounced())
+        
         # 종료 시 설정 저장
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -245,11 +415,13 @@ class PDFExtractorGUI:
         progress_frame.columnconfigure(0, weight=1)
         
         # 상태 표시
-        self.status_label = ttk.Label(progress_frame, text="대기 중...")
+        self.status_var = tk.StringVar(value="대기 중...")
+        self.status_label = ttk.Label(progress_frame, textvariable=self.status_var)
         self.status_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
         # 현재 파일
-        self.current_file_label = ttk.Label(progress_frame, text="")
+        self.current_file_var = tk.StringVar()
+        self.current_file_label = ttk.Label(progress_frame, textvariable=self.current_file_var)
         self.current_file_label.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         # 전체 진행률
@@ -263,11 +435,13 @@ class PDFExtractorGUI:
         self.file_progress_bar.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # 상세 정보
-        self.details_label = ttk.Label(progress_frame, text="")
+        self.details_var = tk.StringVar()
+        self.details_label = ttk.Label(progress_frame, textvariable=self.details_var)
         self.details_label.grid(row=6, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # 처리 통계
-        self.stats_label = ttk.Label(progress_frame, text="")
+        self.stats_var = tk.StringVar()
+        self.stats_label = ttk.Label(progress_frame, textvariable=self.stats_var)
         self.stats_label.grid(row=7, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # 로그 출력 섹션
@@ -296,26 +470,49 @@ class PDFExtractorGUI:
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
         if files:
-            self.pdf_files = list(files)
-            self.update_files_display()
+            self.set_pdf_files(files)
     
     def select_folder(self):
         """PDF 파일들이 있는 폴더 선택"""
         folder = filedialog.askdirectory(title="PDF 폴더 선택")
         if folder:
-            pdf_files = list(Path(folder).glob("*.pdf"))
+            # scandir 1회 순회로 경로와 크기를 함께 수집 (DirEntry.stat은 캐시됨)
+            pdf_files = []
+            pdf_sizes = []
+            with os.scandir(folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if (not name.startswith('.') and name.lower().endswith('.pdf')
+                            and entry.is_file(follow_symlinks=False)):
+                        pdf_files.append(entry.path)
+                        pdf_sizes.append(entry.stat(follow_symlinks=False).st_size)
             if pdf_files:
-                self.pdf_files = [str(f) for f in pdf_files]
-                self.update_files_display()
+                self.set_pdf_files(pdf_files, pdf_sizes)
             else:
                 messagebox.showwarning("경고", "선택한 폴더에 PDF 파일이 없습니다.")
     
+    def set_pdf_files(self, paths, sizes=None):
+        """선택된 PDF 목록 설정 (크기를 모르면 파일마다 stat 1회)"""
+        if sizes is None:
+            sizes = []
+            for path in paths:
+                try:
+                    sizes.append(os.stat(path).st_size)
+                except OSError:
+                    sizes.append(None)
+        
+        self.pdf_files = list(paths)
+        self.pdf_names = [os.path.basename(path) for path in self.pdf_files]
+        self.pdf_sizes = list(sizes)
+        self.update_files_display()
+    
     def select_output_folder(self):
         """출력 폴더 선택"""
         folder = filedialog.askdirectory(title="출력 폴더 선택")
         if folder:
             self.output_dir = folder
             self.output_label.config(text=f"출력 폴더: {folder}")
+            self._save_settings_debounced()
     
     def update_files_display(self):
         """선택된 파일 목록 표시 업데이트"""
@@ -323,7 +520,7 @@ class PDFExtractorGUI:
         if count == 0:
             self.files_label.config(text="선택된 파일이 없습니다.")
         elif count == 1:
-            filename = os.path.basename(self.pdf_files[0])
+            filename = self.pdf_names[0]
             self.files_label.config(text=f"선택된 파일: {filename}")
         else:
             self.files_label.config(text=f"선택된 파일: {count}개")
@@ -350,6 +547,7 @@ class PDFExtractorGUI:
         options = {
             'method': self.method_var.get(),
             'use_ocr': self.ocr_var.get(),
+            'excel_engine': 'xlsxwriter',
         }
         
         # UI 상태 변경
@@ -363,26 +561,81 @@ class PDFExtractorGUI:
         
         self.start_time = time.time()
         
-        # 추출 스레드 시작
-        callback_manager = CallbackManager(self)
-        self.extractor_thread = ExtractorThread(
-            self.pdf_files, self.output_dir, options, callback_manager
+        # 추출 프로세스 시작
+        # (작업 프로세스 풀을 직접 만들어야 하므로 daemon이 아닌 프로세스로 실행)
+        self.message_queue = multiprocessing.Queue()
+        self.extractor_process = multiprocessing.Process(
+            target=extractor_worker,
+            args=(self.pdf_files, self.pdf_names, self.pdf_sizes, self.output_dir, options, self.message_queue)
         )
-        self.extractor_thread.start()
+        self.extractor_process.start()
+        self.root.after(QUEUE_POLL_INTERVAL, self.drain_queue)
+    
+    def is_extracting(self):
+        """추출 프로세스 실행 중 여부"""
+        return self.extractor_process is not None and self.extractor_process.is_alive()
+    
+    def drain_queue(self):
+        """추출 프로세스가 보낸 메시지를 GUI 스레드에서 각 update_* 메서드로 전달"""
+        if self.extractor_process is None:
+            return  # 사용자가 중지해 이미 종료 처리됨
+        
+        # 종료 여부를 먼저 확인해야 종료 직전에 보낸 메시지까지 모두 처리됨
+        alive = self.is_extracting()
+        latest_page = None
+        finished = None
+        
+        try:
+            while True:
+                kind, *args = self.message_queue.get_nowait()
+                if kind == "page":
+                    # 페이지 진행률은 가장 최근 값만 반영
+                    latest_page = args
+                elif kind == "log":
+                    self._log_buf.append(tuple(args))
+                    self._schedule_log_flush()
+                elif kind == "finished":
+                    finished = args
+                else:
+                    if kind == "file_progress":
+                        # 파일 완료 표시가 이전 페이지 진행률보다 우선
+                        latest_page = None
+                    getattr(self, QUEUE_HANDLERS[kind])(*args)
+        except queue.Empty:
+            pass
+        
+        if latest_page:
+            filename, current_page, total_pages = latest_page
+            self.update_current_file(f"현재 파일: {filename}")
+            self.update_file_progress(int((current_page / total_pages) * 100))
+            self.update_progress_details(f"페이지 {current_page}/{total_pages}")
+        
+        if finished:
+            self.extraction_finished(*finished)
+        elif alive:
+            self.root.after(QUEUE_POLL_INTERVAL, self.drain_queue)
+        else:
+            # "finished"를 보내지 못하고 종료됨 (메모리 부족으로 강제 종료, 네이티브 라이브러리 충돌 등)
+            exitcode = self.extractor_process.exitcode
+            self.extractor_process = None
+            self.extraction_finished(False, f"추출 프로세스가 비정상 종료되었습니다. (종료 코드: {exitcode})")
     
     def stop_extraction(self):
         """추출 작업 중지"""
-        if self.extractor_thread and self.extractor_thread.is_alive():
-            # Python threading은 강제 종료가 어려우므로 사용자에게 알림
+        if self.is_extracting():
+            # 진행 중인 파일은 마저 처리되도록 사용자에게 알림
             result = messagebox.askyesno(
                 "작업 중지", 
                 "현재 진행 중인 작업을 중지하시겠습니까?\n"
-                "진행 중인 파일 처리가 완료된 후 중지됩니다."
+                "처리 중인 파일의 결과는 저장되지 않습니다."
             )
-            if result:
+            # 확인 창이 떠 있는 동안 작업이 끝났으면 이미 완료 처리됨
+            if result and self.is_extracting():
                 self.add_log_message("❌ 사용자에 의해 작업이 중지됩니다...")
                 self.update_status("작업 중지 중...")
-                # 스레드는 자연스럽게 종료되도록 함
+                # 다음 작업과 겹치지 않도록 작업 프로세스까지 종료한 뒤 시작 버튼을 다시 활성화
+                _terminate_process_tree(self.extractor_process)
+                self.extractor_process = None
                 self.extraction_finished(False, "작업이 중지되었습니다.")
     
     def extraction_finished(self, success, message):
@@ -404,26 +657,25 @@ class PDFExtractorGUI:
             messagebox.showerror("오류", message)
     
     def open_output_folder(self):
-        """출력 폴더 열기"""
+        """출력 폴더 열기 (셸 없이 실행하고 종료를 기다리지 않음)"""
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", self.output_dir])
-            elif platform.system() == "Windows":
-                subprocess.run(["explorer", self.output_dir])
-            else:  # Linux
-                subprocess.run(["xdg-open", self.output_dir])
+            if sys.platform == "win32":
+                os.startfile(self.output_dir)
+            else:
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen(
+                    [opener, self.output_dir], start_new_session=True,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
         except Exception as e:
             print(f"폴더 열기 실패: {str(e)}")
     
     # 콜백 메서드들
     def update_status(self, message):
-        self.status_label.config(text=message)
+        self.status_var.set(message)
     
     def update_current_file(self, message):
-        self.current_file_label.config(text=message)
+        self.current_file_var.set(message)
     
     def update_progress(self, value):
         self.progress_bar['value'] = value
@@ -432,29 +684,52 @@ class PDFExtractorGUI:
         self.file_progress_bar['value'] = value
     
     def update_progress_details(self, message):
-        self.details_label.config(text=message)
+        self.details_var.set(message)
     
-    def update_processing_stats(self, processed, total, elapsed):
-        if total > 0:
-            remaining = total - processed
-            if processed > 0:
-                avg_time = elapsed / processed
-                estimated_remaining = avg_time * remaining
-                stats_text = (f"진행: {processed}/{total}개 파일 "
-                            f"| 경과: {elapsed:.1f}초 "
-                            f"| 예상 남은 시간: {estimated_remaining:.1f}초")
-            else:
-                stats_text = f"진행: {processed}/{total}개 파일 | 경과: {elapsed:.1f}초"
-            
-            self.stats_label.config(text=stats_text)
+    def update_stats_text(self, stats_text):
+        self.stats_var.set(stats_text)
     
     def add_log_message(self, message):
-        timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry)
+        self._log_buf.append((log_timestamp(), message))
+        self._schedule_log_flush()
+    
+    def _schedule_log_flush(self):
+        """대기 중인 로그 출력을 유휴 시점에 1회만 예약"""
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after_idle(self._flush_log)
+    
+    def _flush_log(self):
+        """버퍼에 쌓인 로그를 한 번의 insert로 출력"""
+        self._log_pending = False
+        if not self._log_buf:
+            return
+        
+        # 항목별 문자열을 만들지 않고 버퍼 하나에 이어 씀
+        buf = io.StringIO()
+        while self._log_buf:
+            timestamp, message = self._log_buf.popleft()
+            buf.write('[')
+            buf.write(timestamp)
+            buf.write('] ')
+            buf.write(message)
+            buf.write('\n')
+        
+        text = buf.getvalue()
+        self.log_text.insert(tk.END, text)
+        self._log_lines += text.count("\n")
+        
+        # 오래된 줄 삭제로 위젯 크기 제한
+        if self._log_lines > LOG_MAX_LINES:
+            excess = self._log_lines - LOG_MAX_LINES
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = LOG_MAX_LINES
+        
         self.log_text.see(tk.END)
     
     def clear_log(self):
+        self._log_buf.clear()
+        self._log_lines = 0
         self.log_text.delete(1.0, tk.END)
     
     def save_log(self):
@@ -489,16 +764,25 @@ class PDFExtractorGUI:
         
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    saved_settings = json.load(f)
-                    default_settings.update(saved_settings)
+                data = self.settings_file.read_bytes()
+                saved_settings = orjson.loads(data) if orjson else json.loads(data)
+                default_settings.update(saved_settings)
         except Exception as e:
             print(f"설정 로드 실패: {e}")
         
         return default_settings
     
+    def _save_settings_debounced(self):
+        """설정 저장을 SETTINGS_SAVE_DELAY 뒤로 예약 (이전 예약은 취소)"""
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+        self._settings_save_job = self.root.after(SETTINGS_SAVE_DELAY, self.save_settings)
+    
     def save_settings(self):
         """설정 파일 저장"""
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+            self._settings_save_job = None
         try:
             settings = {
                 'window_geometry': self.root.geometry(),
@@ -507,8 +791,14 @@ class PDFExtractorGUI:
                 'use_ocr': self.ocr_var.get()
             }
             
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            if orjson:
+                data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(settings, indent=2, ensure_ascii=False).encode('utf-8')
+            # 임시 파일에 한 번에 쓴 뒤 교체 (저장 중 종료되어도 기존 설정 유지)
+            tmp_file = self.settings_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.settings_file)
         except Exception as e:
             print(f"설정 저장 실패: {e}")
     
@@ -531,13 +821,14 @@ class PDFExtractorGUI:
     def on_closing(self):
         """애플리케이션 종료 시 처리"""
         # 진행 중인 작업이 있다면 확인
-        if self.extractor_thread and self.extractor_thread.is_alive():
+        if self.is_extracting():
             result = messagebox.askyesno(
                 "프로그램 종료", 
                 "작업이 진행 중입니다. 정말 종료하시겠습니까?"
             )
             if not result:
                 return
+            _terminate_process_tree(self.extractor_process)
         
         # 설정 저장
         self.save_settings()
@@ -566,4 +857,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 실행 파일에서 작업 프로세스 시작용
     main()
@@ -7,12 +7,20 @@ PDF 파일에서 데이터를 추출하여 Excel 파일로 저장하는 간단
 
 import sys
 import os
-import traceback
 import json
 import time
+import multiprocessing
 import psutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+# 설정 파일 직렬화 (orjson이 있으면 사용, 없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Qt 환경 설정 (PyQt5 GUI 문제 해결)
 def setup_qt_environment():
@@ -33,15 +41,13 @@ setup_qt_environment()
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-    QWidget, QPushButton, QLabel, QTextEdit, QFileDialog,
-    QProgressBar, QMessageBox, QInputDialog, QTabWidget,
+    QWidget, QPushButton, QLabel, QTextEdit, QPlainTextEdit, QFileDialog,
+    QProgressBar, QMessageBox, QTabWidget,
     QGroupBox, QGridLayout, QComboBox, QSpinBox, QCheckBox,
-    QDialog, QDialogButtonBox
+    QDialog, QDialogButtonBox, QLayout
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QTime
-from PyQt5.QtGui import QFont, QPalette, QColor
-
-from pdf_extractor import PDFExtractor
+from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QElapsedTimer, QStandardPaths, QUrl, QSize
+from PyQt5.QtGui import QFont, QPalette, QColor, QTextDocument, QDesktopServices
 
 # 테마 색상 정의 (라이트 모드만 사용)
 THEME = {
@@ -55,104 +61,221 @@ THEME = {
     'hover': '#F5F5F5'
 }
 
+# 시스템 성능 표시 갱신 주기 (ms, 창이 비활성일 때는 느리게)
+PERF_INTERVAL_ACTIVE = 1000
+PERF_INTERVAL_INACTIVE = 2000
+
+# 로그 창 최대 줄 수와 로그 일괄 반영 주기 (ms)
+LOG_MAX_BLOCKS = 500
+LOG_FLUSH_INTERVAL = 100
+
+# 마지막으로 만든 로그 타임스탬프 (초, 문자열)
+_ts_cache = (0, "")
+
+# 작업 프로세스별 추출기 (_init_worker에서 생성)
+_EXTRACTOR = None
+
+# 사용률 구간별 라벨 글자색 (QPalette로 미리 만들어 교체)
+USAGE_COLORS = {
+    'high': '#F44336',  # 빨간색
+    'warn': '#FF9800',  # 주황색
+    'normal': '#4CAF50'  # 초록색
+}
+
+
+def usage_level(percent: float, warn: float, high: float) -> str:
+    """사용률 구간 (USAGE_COLORS 키)"""
+    if percent > high:
+        return 'high'
+    if percent > warn:
+        return 'warn'
+    return 'normal'
+
+
+def log_timestamp() -> str:
+    """로그용 "%H:%M:%S" 타임스탬프 (같은 초 안에서는 strftime 재사용)"""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
+def get_worker_count(file_count: int) -> int:
+    """사용 가능한 CPU 수 기준 작업 프로세스 수"""
+    return max(1, min(os.cpu_count() or 1, file_count))
+
+
+def get_settings_path() -> Path:
+    """사용자별 앱 데이터 폴더의 설정 파일 경로 (작업 디렉토리와 무관)"""
+    app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    if not app_data:
+        return Path('settings.json')
+    return Path(app_data) / 'settings.json'
+
+
+def _init_worker():
+    """작업 프로세스 초기화 (추출기는 프로세스당 한 번만 생성해 모든 파일에 재사용)"""
+    global _EXTRACTOR
+    from pdf_extractor import PDFExtractor
+    
+    _EXTRACTOR = PDFExtractor()
+
+
+def _extract_one(pdf_file: str, output_dir: str, options: dict, extractor=None):
+    """PDF 1개 추출 → (경로, 성공 여부, 페이지 수) (extractor 생략 시 작업 프로세스의 추출기 사용)"""
+    if extractor is None:
+        extractor = _EXTRACTOR
+    
+    from pdf_extractor import read_pdf_bytes, open_pdf_document  # 작업 프로세스/스레드에서 이미 불러온 모듈
+    
+    # 파일을 한 번만 읽고 열어 페이지 수 확인과 추출에 함께 사용
+    pdf_bytes = read_pdf_bytes(pdf_file)
+    try:
+        doc = open_pdf_document(pdf_file, pdf_bytes)
+    except Exception as e:
+        extractor.logger.warning(f"PDF 열기 실패, 페이지 수 없이 진행: {pdf_file} ({e})")
+        doc = None
+    
+    try:
+        total_pages = doc.page_count if doc is not None else 0
+        
+        success = extractor.extract_to_excel(pdf_file, output_dir, options, doc=doc, pdf_bytes=pdf_bytes)
+        return pdf_file, success, total_pages
+    finally:
+        if doc is not None:
+            doc.close()
+
 
 class ExtractorThread(QThread):
-    """PDF 추출 작업을 백그라운드에서 수행하는 스레드"""
-    progress = pyqtSignal(int)  # 전체 진행률 (0-100)
-    file_progress = pyqtSignal(int)  # 현재 파일 진행률 (0-100)
-    status = pyqtSignal(str)  # 상태 메시지
-    current_file = pyqtSignal(str)  # 현재 처리 중인 파일명
-    progress_details = pyqtSignal(str)  # 상세 진행 정보 (페이지 등)
-    log_message = pyqtSignal(str)  # 로그 메시지
-    processing_stats = pyqtSignal(int, int, float)  # 처리된 파일 수, 전체 파일 수, 경과 시간
+    """PDF 추출 작업을 프로세스 풀에 분배하고 결과를 시그널로 전달하는 스레드"""
+    # 위젯 상태 묶음 (파일 단위로 한 번만 전송: status, current_file, details, progress, file_progress, logs, stats)
+    update = pyqtSignal(dict)
     finished = pyqtSignal(bool, str)
     
-    def __init__(self, pdf_files: List[str], output_dir: str, options: dict):
+    def __init__(self, pdf_files: List[str], pdf_sizes: List[Optional[int]], output_dir: str, options: dict):
         super().__init__()
         self.pdf_files = pdf_files
+        self.pdf_sizes = pdf_sizes
         self.output_dir = output_dir
         self.options = options
-        self.extractor = PDFExtractor()
         
     def run(self):
         try:
-            import time
-            start_time = time.time()
+            start_time = time.monotonic()
             
             total_files = len(self.pdf_files)
-            self.status.emit("추출 작업 시작...")
-            self.log_message.emit(f"📁 총 {total_files}개 파일 처리 시작")
+            workers = get_worker_count(total_files)
+            if total_files == 1:
+                logs = ["📁 총 1개 파일 처리 시작"]
+            else:
+                logs = [f"📁 총 {total_files}개 파일 처리 시작 (작업 프로세스 {workers}개)"]
             
-            for i, pdf_file in enumerate(self.pdf_files):
+            # 파일 정보 표시 (크기는 선택 시점에 한 번만 계산해 둔 값을 사용)
+            for pdf_file, size in zip(self.pdf_files, self.pdf_sizes):
                 filename = os.path.basename(pdf_file)
-                self.current_file.emit(f"현재 파일: {filename}")
-                
-                # 파일 정보 표시
-                try:
-                    file_size = os.path.getsize(pdf_file) / (1024 * 1024)  # MB
-                    size_info = f"({file_size:.1f}MB)" if file_size > 1 else f"({file_size*1024:.0f}KB)"
-                    self.log_message.emit(f"📄 처리 시작: {filename} {size_info}")
-                    
-                    if file_size > 50:
-                        self.status.emit(f"대용량 파일 처리 중...")
-                        self.log_message.emit(f"⚠️  대용량 파일 감지: {file_size:.1f}MB")
-                    else:
-                        self.status.emit(f"파일 처리 중...")
-                except Exception as e:
-                    self.log_message.emit(f"❌ 파일 정보 읽기 실패: {str(e)}")
-                
-                # 파일 진행률 초기화
-                self.file_progress.emit(0)
-                
-                # PDF 페이지 수 확인 (간단한 체크)
-                try:
-                    import fitz  # PyMuPDF
-                    doc = fitz.open(pdf_file)
-                    total_pages = len(doc)
-                    doc.close()
-                    self.progress_details.emit(f"0/{total_pages} 페이지")
-                    self.log_message.emit(f"📖 총 {total_pages}페이지 감지")
-                except:
-                    total_pages = 0
-                    self.progress_details.emit("페이지 수 확인 불가")
-                
-                # PDF 추출 수행
-                self.log_message.emit(f"🔄 데이터 추출 시작...")
-                self.file_progress.emit(50)  # 중간 진행률
+                if size is None:
+                    logs.append(f"❌ 파일 정보 읽기 실패: {filename}")
+                    continue
                 
-                success = self.extractor.extract_to_excel(
-                    pdf_file, self.output_dir, self.options
-                )
+                file_size = size / (1024 * 1024)  # MB
+                size_info = f"({file_size:.1f}MB)" if file_size > 1 else f"({file_size*1024:.0f}KB)"
+                logs.append(f"📄 처리 대기: {filename} {size_info}")
                 
-                if not success:
-                    self.log_message.emit(f"❌ 실패: {filename}")
-                    self.finished.emit(False, f"파일 처리 실패: {filename}")
-                    return
-                
-                # 파일 완료
-                self.file_progress.emit(100)
-                if total_pages > 0:
-                    self.progress_details.emit(f"{total_pages}/{total_pages} 페이지")
-                
-                # 전체 진행률 업데이트
-                overall_progress = int((i + 1) / total_files * 100)
-                self.progress.emit(overall_progress)
-                
-                elapsed_time = time.time() - start_time
-                self.log_message.emit(f"✅ 완료: {filename} ({elapsed_time:.1f}초)")
-                self.status.emit(f"완료: {i+1}/{total_files} 파일")
+                if file_size > 50:
+                    logs.append(f"⚠️  대용량 파일 감지: {file_size:.1f}MB")
+            
+            # 파일 진행률 초기화
+            logs.append("🔄 데이터 추출 시작...")
+            self.update.emit({'status': "파일 처리 중...", 'file_progress': 0, 'logs': logs})
+            
+            if total_files == 1:
+                self._run_single(self.pdf_files[0], start_time)
+                return
+            
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [
+                    executor.submit(_extract_one, pdf_file, self.output_dir, self.options)
+                    for pdf_file in self.pdf_files
+                ]
                 
-                # 처리 통계 업데이트
-                self.processing_stats.emit(i + 1, total_files, elapsed_time)
+                for done, future in enumerate(as_completed(futures), start=1):
+                    pdf_file, success, total_pages = future.result()
+                    filename = os.path.basename(pdf_file)
+                    
+                    if not success:
+                        # 대기 중인 파일은 취소하고 실패 처리 (실행 중인 파일은 끝날 때까지 대기)
+                        for pending in futures:
+                            pending.cancel()
+                        self.update.emit({'logs': [f"❌ 실패: {filename}"]})
+                        self.finished.emit(False, f"파일 처리 실패: {filename}")
+                        return
+                    
+                    # 파일 완료 상태를 한 번에 전송
+                    elapsed_time = time.monotonic() - start_time
+                    state = {
+                        'current_file': f"현재 파일: {filename}",
+                        'file_progress': 100,
+                        'progress': int(done / total_files * 100),
+                        'status': f"완료: {done}/{total_files} 파일",
+                        'logs': [f"✅ 완료: {filename} ({elapsed_time:.1f}초)"],
+                        'stats': (done, total_files, elapsed_time),
+                    }
+                    if total_pages > 0:
+                        state['details'] = f"{total_pages}/{total_pages} 페이지"
+                    self.update.emit(state)
             
-            total_time = time.time() - start_time
-            self.status.emit("모든 파일 처리 완료!")
-            self.log_message.emit(f"🎉 전체 작업 완료! (총 {total_time:.1f}초)")
+            total_time = time.monotonic() - start_time
+            self.update.emit({
+                'status': "모든 파일 처리 완료!",
+                'logs': [f"🎉 전체 작업 완료! (총 {total_time:.1f}초)"],
+            })
             self.finished.emit(True, f"총 {total_files}개 파일이 성공적으로 처리되었습니다.")
             
         except Exception as e:
-            self.log_message.emit(f"💥 오류 발생: {str(e)}")
+            self.update.emit({'logs': [f"💥 오류 발생: {str(e)}"]})
             self.finished.emit(False, f"오류 발생: {str(e)}")
+    
+    def _run_single(self, pdf_file: str, start_time: float):
+        """파일 1개는 프로세스 풀 없이 이 스레드에서 바로 추출하고 결과를 한 번만 전송"""
+        from pdf_extractor import PDFExtractor
+        
+        filename = os.path.basename(pdf_file)
+        _, success, total_pages = _extract_one(
+            pdf_file, self.output_dir, self.options, PDFExtractor()
+        )
+        if not success:
+            self.update.emit({'logs': [f"❌ 실패: {filename}"]})
+            self.finished.emit(False, f"파일 처리 실패: {filename}")
+            return
+        
+        elapsed_time = time.monotonic() - start_time
+        state = {
+            'current_file': f"현재 파일: {filename}",
+            'file_progress': 100,
+            'progress': 100,
+            'status': "모든 파일 처리 완료!",
+            'logs': [f"✅ 완료: {filename} ({elapsed_time:.1f}초)"],
+            'stats': (1, 1, elapsed_time),
+        }
+        if total_pages > 0:
+            state['details'] = f"{total_pages}/{total_pages} 페이지"
+        self.update.emit(state)
+        self.finished.emit(True, "총 1개 파일이 성공적으로 처리되었습니다.")
+
+
+class BackendLoader(QThread):
+    """추출 백엔드 모듈(pdf_extractor → camelot, tabula, pdfplumber, OpenCV 등)을 백그라운드에서 import"""
+    loaded = pyqtSignal(bool, str)  # 성공 여부, 오류 메시지
+    
+    def run(self):
+        try:
+            import pdf_extractor
+        except Exception as e:
+            self.loaded.emit(False, str(e))
+            return
+        pdf_extractor.check_preloaded_allocator()
+        self.loaded.emit(True, "")
 
 
 class PDFExtractorGUI(QMainWindow):
@@ -161,7 +284,39 @@ class PDFExtractorGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.pdf_files = []
+        self.pdf_sizes = []
         self.output_directory = ""
+        self.settings_file = get_settings_path()
+        self._job_timer = QElapsedTimer()
+        
+        # 추출 백엔드 import 완료 여부 (kick_off_backend_load에서 백그라운드로 로드)
+        self._backends_ready = False
+        self._backend_loader = None
+        
+        # 다이얼로그는 처음 열 때 생성해 재사용
+        self._help_dialog = None
+        self._results_dialog = None
+        
+        # 마지막으로 표시한 성능 값 (바뀐 경우에만 라벨 갱신)
+        self._last_cpu = None
+        self._last_cpu_level = None
+        self._last_mem_text = None
+        self._last_mem_level = None
+        self._last_rss_text = None
+        
+        # 구간별 팔레트 (갱신 시 스타일시트 재파싱 없이 교체만 함)
+        self._usage_palettes = {}
+        for level, color in USAGE_COLORS.items():
+            palette = QPalette()
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._usage_palettes[level] = palette
+        
+        # 타이머가 한 번에 반영할 로그 메시지
+        self._log_queue = deque()
+        self._process = psutil.Process()
+        # 첫 cpu_percent 호출은 기준점만 잡고 0을 반환하므로 미리 한 번 호출
+        psutil.cpu_percent(interval=None)
+        
         self.init_ui()
         self.load_settings()
         
@@ -269,9 +424,9 @@ class PDFExtractorGUI(QMainWindow):
         status_layout.addWidget(self.status_label)
         
         # 메모리 사용량 표시
-        self.memory_label = QLabel("메모리: 0MB")
-        self.memory_label.setStyleSheet("color: gray; font-size: 10px;")
-        status_layout.addWidget(self.memory_label)
+        self.status_memory_label = QLabel("메모리: 0MB")
+        self.status_memory_label.setStyleSheet("color: gray; font-size: 10px;")
+        status_layout.addWidget(self.status_memory_label)
         
         # 처리 시간 및 속도 표시
         self.time_label = QLabel("처리 시간: 0초")
@@ -279,9 +434,9 @@ class PDFExtractorGUI(QMainWindow):
         status_layout.addWidget(self.time_label)
         
         # 처리 속도 표시
-        self.speed_label = QLabel("처리 속도: -")
-        self.speed_label.setStyleSheet("color: gray; font-size: 10px;")
-        status_layout.addWidget(self.speed_label)
+        self.status_speed_label = QLabel("처리 속도: -")
+        self.status_speed_label.setStyleSheet("color: gray; font-size: 10px;")
+        status_layout.addWidget(self.status_speed_label)
         status_layout.addStretch()
         
         main_layout.addLayout(status_layout)
@@ -289,21 +444,25 @@ class PDFExtractorGUI(QMainWindow):
         # 시스템 성능 모니터링 그룹
         perf_group = QGroupBox("시스템 성능")
         perf_layout = QGridLayout(perf_group)
+        bold_font = QFont()
+        bold_font.setBold(True)
         
         # CPU 사용률
         perf_layout.addWidget(QLabel("CPU 사용률:"), 0, 0)
         self.cpu_label = QLabel("0%")
+        self.cpu_label.setFont(bold_font)
         perf_layout.addWidget(self.cpu_label, 0, 1)
         
         # 메모리 사용률
         perf_layout.addWidget(QLabel("메모리 사용률:"), 1, 0)
-        self.memory_label = QLabel("0 MB")
-        perf_layout.addWidget(self.memory_label, 1, 1)
+        self.perf_memory_label = QLabel("0 MB")
+        self.perf_memory_label.setFont(bold_font)
+        perf_layout.addWidget(self.perf_memory_label, 1, 1)
         
         # 처리 속도
         perf_layout.addWidget(QLabel("처리 속도:"), 2, 0)
-        self.speed_label = QLabel("0 파일/초")
-        perf_layout.addWidget(self.speed_label, 2, 1)
+        self.perf_speed_label = QLabel("0 파일/초")
+        perf_layout.addWidget(self.perf_speed_label, 2, 1)
         
         # 예상 완료 시간
         perf_layout.addWidget(QLabel("예상 완료:"), 3, 0)
@@ -312,19 +471,27 @@ class PDFExtractorGUI(QMainWindow):
         
         progress_layout.addWidget(perf_group)
         
+        # 경과 시간 타이머 (추출 시작 시 start)
+        self.time_timer = QTimer()
+        self.time_timer.timeout.connect(self.update_elapsed_time)
+        
         # 성능 모니터링 타이머
         self.perf_timer = QTimer()
         self.perf_timer.timeout.connect(self.update_performance_info)
-        self.perf_timer.start(1000)  # 1초마다 업데이트
+        self.perf_timer.start(PERF_INTERVAL_ACTIVE)
+        QApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
         
         # 로그 영역
         log_group = QGroupBox("실시간 로그")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # 로그는 서식 해석이 필요 없으므로 QPlainTextEdit 사용 (undo 기록, 줄바꿈 계산 생략)
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(120)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #f5f5f5;
                 border: 1px solid #ddd;
                 border-radius: 3px;
@@ -332,8 +499,15 @@ class PDFExtractorGUI(QMainWindow):
                 font-size: 11px;
             }
         """)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_text)
         
+        # 로그 메시지를 모아 한 번에 반영하는 타이머
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self.log_flush_timer.timeout.connect(self.flush_log_messages)
+        
         # 로그 제어 버튼
         log_controls = QHBoxLayout()
         self.clear_log_btn = QPushButton("로그 지우기")
@@ -486,18 +660,38 @@ class PDFExtractorGUI(QMainWindow):
             self, "PDF 파일 선택", "", "PDF files (*.pdf)"
         )
         if files:
-            self.pdf_files = files
-            self.update_file_label()
-            self.check_ready_to_extract()
+            self.set_pdf_files(files)
             
     def select_pdf_folder(self):
         """PDF 폴더 선택 (일괄 처리)"""
         folder = QFileDialog.getExistingDirectory(self, "PDF 폴더 선택")
         if folder:
-            pdf_files = list(Path(folder).glob("*.pdf"))
-            self.pdf_files = [str(f) for f in pdf_files]
-            self.update_file_label()
-            self.check_ready_to_extract()
+            # scandir 1회 순회로 경로와 크기를 함께 수집 (DirEntry.stat은 캐시됨)
+            pdf_files = []
+            pdf_sizes = []
+            with os.scandir(folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if (not name.startswith('.') and name.lower().endswith('.pdf')
+                            and entry.is_file(follow_symlinks=False)):
+                        pdf_files.append(entry.path)
+                        pdf_sizes.append(entry.stat(follow_symlinks=False).st_size)
+            self.set_pdf_files(pdf_files, pdf_sizes)
+    
+    def set_pdf_files(self, paths, sizes=None):
+        """선택된 PDF 목록 설정 (크기를 모르면 파일마다 stat 1회)"""
+        if sizes is None:
+            sizes = []
+            for path in paths:
+                try:
+                    sizes.append(os.stat(path).st_size)
+                except OSError:
+                    sizes.append(None)
+        
+        self.pdf_files = list(paths)
+        self.pdf_sizes = list(sizes)
+        self.update_file_label()
+        self.check_ready_to_extract()
             
     def select_output_directory(self):
         """출력 디렉토리 선택"""
@@ -519,53 +713,57 @@ class PDFExtractorGUI(QMainWindow):
         else:
             self.selected_files_label.setText("선택된 파일: 없음")
             
-    def update_memory_display(self):
-        """메모리 사용량 표시 업데이트"""
-        try:
-            # 현재 프로세스의 메모리 사용량 (MB)
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            
-            # 시스템 전체 메모리 사용률
-            system_memory = psutil.virtual_memory()
-            system_usage = system_memory.percent
-            
-            status_text = f"메모리: {memory_mb:.1f}MB | 시스템: {system_usage:.1f}%"
-            if hasattr(self, 'memory_label'):
-                self.memory_label.setText(status_text)
-        except Exception as e:
-            if hasattr(self, 'memory_label'):
-                self.memory_label.setText("메모리 정보 확인 불가")
-    
     def check_ready_to_extract(self):
         """추출 준비 상태 확인"""
-        ready = bool(self.pdf_files and self.output_directory)
-        if hasattr(self, 'extract_btn'):
-            self.extract_btn.setEnabled(ready)
+        ready = bool(self.pdf_files and self.output_directory and self._backends_ready)
+        self.extract_btn.setEnabled(ready)
         
         # 상태 표시 업데이트
-        if ready:
-            if hasattr(self, 'status_label'):
-                self.status_label.setText("추출 준비 완료")
+        if not self._backends_ready:
+            self.status_label.setText("추출 모듈 불러오는 중...")
+        elif ready:
+            self.status_label.setText("추출 준비 완료")
         else:
-            if hasattr(self, 'status_label'):
-                self.status_label.setText("파일과 출력 폴더를 선택하세요")
+            self.status_label.setText("파일과 출력 폴더를 선택하세요")
+    
+    def kick_off_backend_load(self):
+        """창을 먼저 띄운 뒤 무거운 추출 백엔드를 백그라운드 스레드에서 import"""
+        self._backend_loader = BackendLoader()
+        self._backend_loader.loaded.connect(self.on_backends_loaded)
+        self._backend_loader.start()
+        self.check_ready_to_extract()
+    
+    def on_backends_loaded(self, success: bool, error: str):
+        """백엔드 로드 완료 처리 (성공 시 추출 버튼 활성화 조건 재확인)"""
+        if not success:
+            self.status_label.setText("추출 모듈 로드 실패")
+            self.add_log_message(f"💥 추출 모듈 로드 실패: {error}")
+            return
+        self._backends_ready = True
+        self.check_ready_to_extract()
     
     def get_extraction_options(self):
-        """추출 옵션 수집"""
-        max_pages_value = getattr(self, 'max_pages_spin', type('obj', (object,), {'value': lambda: 500})).value()
+        """추출 옵션 수집 (위젯이 없으면 기본값 사용)"""
+        def _value(name, default):
+            widget = getattr(self, name, None)
+            return widget.value() if widget is not None else default
+        
+        def _checked(name, default):
+            widget = getattr(self, name, None)
+            return widget.isChecked() if widget is not None else default
+        
+        max_pages_value = _value('max_pages_spin', 500)
         # 0인 경우 500으로 변경 (모든 페이지 처리를 위함)
         if max_pages_value == 0:
             max_pages_value = 500
             
         return {
-            'min_rows': getattr(self, 'min_rows_spin', type('obj', (object,), {'value': lambda: 3})).value(),
-            'min_cols': getattr(self, 'min_cols_spin', type('obj', (object,), {'value': lambda: 2})).value(),
-            'separate_sheets': getattr(self, 'separate_sheets_checkbox', type('obj', (object,), {'isChecked': lambda: True})).isChecked(),
-            'include_text': getattr(self, 'include_text_checkbox', type('obj', (object,), {'isChecked': lambda: True})).isChecked(),
+            'min_rows': _value('min_rows_spin', 3),
+            'min_cols': _value('min_cols_spin', 2),
+            'separate_sheets': _checked('separate_sheets_checkbox', True),
+            'include_text': _checked('include_text_checkbox', True),
             'max_pages': max_pages_value,
-            'batch_size': getattr(self, 'batch_size_spin', type('obj', (object,), {'value': lambda: 5})).value()
+            'batch_size': _value('batch_size_spin', 5)
         }
         
     def start_extraction(self):
@@ -575,65 +773,65 @@ class PDFExtractorGUI(QMainWindow):
             return
             
         # UI 상태 초기화
-        if hasattr(self, 'extract_btn'):
-            self.extract_btn.setEnabled(False)
-        if hasattr(self, 'progress_bar'):
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
-        if hasattr(self, 'file_progress_bar'):
-            self.file_progress_bar.setVisible(True)
-            self.file_progress_bar.setValue(0)
-        
-        # 시작 시간 기록
-        self.start_time = QTime.currentTime()
+        self.extract_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.file_progress_bar.setVisible(True)
+        self.file_progress_bar.setValue(0)
+        
+        # 시작 시간 기록 (시스템 시계 변경에 영향받지 않는 단조 타이머)
+        self._job_timer.start()
         
         # 추출 옵션 수집
         options = self.get_extraction_options()
         
         # 백그라운드 스레드에서 추출 수행
         self.extractor_thread = ExtractorThread(
-            self.pdf_files, self.output_directory, options
+            self.pdf_files, self.pdf_sizes, self.output_directory, options
         )
         
-        # 시그널 연결
-        if hasattr(self, 'progress_bar'):
-            self.extractor_thread.progress.connect(self.progress_bar.setValue)
-        if hasattr(self, 'file_progress_bar'):
-            self.extractor_thread.file_progress.connect(self.file_progress_bar.setValue)
-        if hasattr(self, 'status_label'):
-            self.extractor_thread.status.connect(self.status_label.setText)
-        if hasattr(self, 'current_file_label'):
-            self.extractor_thread.current_file.connect(self.current_file_label.setText)
-        if hasattr(self, 'progress_details_label'):
-            self.extractor_thread.progress_details.connect(self.progress_details_label.setText)
-        if hasattr(self, 'log_text'):
-            self.extractor_thread.log_message.connect(self.add_log_message)
-        if hasattr(self, 'speed_label'):
-            self.extractor_thread.processing_stats.connect(self.update_processing_stats)
-        
+        # 시그널 연결 (위젯 값은 바뀐 경우에만 반영하도록 마지막 값 초기화)
+        self._last_update = {'progress': 0, 'file_progress': 0}
+        self.extractor_thread.update.connect(self.apply_thread_update)
         self.extractor_thread.finished.connect(self.extraction_finished)
         self.extractor_thread.start()
         
-        if hasattr(self, 'log_text'):
-            self.add_log_message("🚀 추출 작업을 시작합니다...")
+        self.add_log_message("🚀 추출 작업을 시작합니다...")
         
         # 시간 업데이트 타이머 시작
-        if not hasattr(self, 'time_timer'):
-            self.time_timer = QTimer()
-            self.time_timer.timeout.connect(self.update_elapsed_time)
         self.time_timer.start(1000)  # 1초마다 업데이트
         
     def show_help(self):
         """도움말 다이얼로그 표시"""
-        help_dialog = HelpDialog(self)
-        help_dialog.exec_()
+        # 처음 열 때만 생성하고 이후에는 재사용
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec_()
+    
+    def apply_thread_update(self, state: dict):
+        """ExtractorThread가 묶어 보낸 상태를 위젯에 한 번에 반영"""
+        setters = {
+            'status': self.status_label.setText,
+            'current_file': self.current_file_label.setText,
+            'details': self.progress_details_label.setText,
+            'progress': self.progress_bar.setValue,
+            'file_progress': self.file_progress_bar.setValue,
+        }
+        for key, setter in setters.items():
+            if key in state and state[key] != self._last_update.get(key):
+                self._last_update[key] = state[key]
+                setter(state[key])
+        
+        for message in state.get('logs', ()):
+            self.add_log_message(message)
+        if 'stats' in state:
+            self.update_processing_stats(*state['stats'])
     
     def extraction_finished(self, success: bool, message: str):
         """추출 작업 완료 처리"""
         self.progress_bar.setVisible(False)
         self.file_progress_bar.setVisible(False)
-        if hasattr(self, 'extract_btn'):
-            self.extract_btn.setEnabled(True)
+        self.extract_btn.setEnabled(True)
         
         if success:
             self.status_label.setText("✅ 완료!")
@@ -641,59 +839,68 @@ class PDFExtractorGUI(QMainWindow):
             
             # 처리 완료 다이얼로그 표시
             if self.output_directory:
-                results_dialog = ResultsDialog(
-                    self.output_directory, 
-                    len(self.pdf_files), 
-                    self
-                )
-                results_dialog.exec_()
+                if self._results_dialog is None:
+                    self._results_dialog = ResultsDialog(
+                        self.output_directory, 
+                        len(self.pdf_files), 
+                        self
+                    )
+                else:
+                    self._results_dialog.set_results(self.output_directory, len(self.pdf_files))
+                self._results_dialog.exec_()
         else:
             self.status_label.setText("❌ 실패")
             self.status_label.setStyleSheet("font-weight: bold; color: #F44336;")
             QMessageBox.critical(self, "오류", message)
     
     def add_log_message(self, message: str):
-        """로그 메시지 추가"""
-        if hasattr(self, 'log_text'):
-            current_time = QTime.currentTime().toString('hh:mm:ss')
-            formatted_message = f"[{current_time}] {message}"
-            self.log_text.append(formatted_message)
-            # 자동 스크롤
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.End)
-            self.log_text.setTextCursor(cursor)
+        """로그 메시지 추가 (타이머가 모아서 반영)"""
+        self._log_queue.append(f"[{log_timestamp()}] {message}")
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+    
+    def flush_log_messages(self):
+        """쌓인 로그 메시지를 한 번의 append로 반영"""
+        if not self._log_queue:
+            return
+        batch = list(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.appendPlainText('\n'.join(batch))
+        # 자동 스크롤 (반영할 때 한 번만)
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(cursor.End)
+        self.log_text.setTextCursor(cursor)
     
     def clear_log(self):
         """로그 지우기"""
-        if hasattr(self, 'log_text'):
-            self.log_text.clear()
-            self.add_log_message("📝 로그가 지워졌습니다.")
+        self._log_queue.clear()
+        self.log_text.clear()
+        self.add_log_message("📝 로그가 지워졌습니다.")
     
     def update_elapsed_time(self):
         """경과 시간 및 처리 속도 업데이트"""
-        if hasattr(self, 'start_time') and hasattr(self, 'time_label'):
-            elapsed = self.start_time.secsTo(QTime.currentTime())
-            if elapsed >= 60:
-                minutes = elapsed // 60
-                seconds = elapsed % 60
-                time_text = f"처리 시간: {minutes}분 {seconds}초"
-            else:
-                time_text = f"처리 시간: {elapsed}초"
-            self.time_label.setText(time_text)
-            
-            # 처리 속도 계산 (진행률 기준)
-            if hasattr(self, 'speed_label') and hasattr(self, 'progress_bar') and elapsed > 0:
-                progress = self.progress_bar.value()
-                if progress > 0:
-                    speed = progress / elapsed
-                    if speed >= 1:
-                        speed_text = f"처리 속도: {speed:.1f}%/초"
-                    else:
-                        eta = (100 - progress) / speed if speed > 0 else 0
-                        speed_text = f"예상 완료: {eta:.0f}초 후"
-                    self.speed_label.setText(speed_text)
+        elapsed = self._job_timer.elapsed() // 1000
+        if elapsed >= 60:
+            minutes = elapsed // 60
+            seconds = elapsed % 60
+            time_text = f"처리 시간: {minutes}분 {seconds}초"
+        else:
+            time_text = f"처리 시간: {elapsed}초"
+        self.time_label.setText(time_text)
+        
+        # 처리 속도 계산 (진행률 기준)
+        if elapsed > 0:
+            progress = self.progress_bar.value()
+            if progress > 0:
+                speed = progress / elapsed
+                if speed >= 1:
+                    speed_text = f"처리 속도: {speed:.1f}%/초"
                 else:
-                    self.speed_label.setText("처리 속도: 계산 중...")
+                    eta = (100 - progress) / speed if speed > 0 else 0
+                    speed_text = f"예상 완료: {eta:.0f}초 후"
+                self.status_speed_label.setText(speed_text)
+            else:
+                self.status_speed_label.setText("처리 속도: 계산 중...")
 
     def save_settings(self):
         """설정을 파일에 저장"""
@@ -707,52 +914,71 @@ class PDFExtractorGUI(QMainWindow):
         }
         
         try:
-            with open('settings.json', 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            # 사람이 읽을 파일이 아니므로 들여쓰기 없이 저장, 임시 파일에 쓴 뒤 교체
+            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.settings_file.with_suffix('.json.tmp')
+            if orjson:
+                data = orjson.dumps(settings)
+            else:
+                data = json.dumps(settings, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.settings_file)
         except Exception as e:
             print(f"설정 저장 실패: {e}")
     
     def load_settings(self):
         """설정 파일 로드"""
+        if not self.settings_file.exists():
+            return
         try:
-            with open('settings.json', 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            data = self.settings_file.read_bytes()
+            settings = orjson.loads(data) if orjson else json.loads(data)
                 
             self.output_directory = settings.get('last_output_directory', '')
                 
         except Exception as e:
             print(f"설정 로드 실패: {e}")
 
+    def on_application_state_changed(self, state):
+        """창이 비활성이면 성능 표시 갱신 주기를 늘림"""
+        active = state == Qt.ApplicationActive
+        self.perf_timer.setInterval(PERF_INTERVAL_ACTIVE if active else PERF_INTERVAL_INACTIVE)
+    
     def update_performance_info(self):
-        """성능 정보 업데이트"""
+        """성능 정보 업데이트 (값이 바뀐 라벨만 갱신)"""
         try:
             # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=None)
-            if hasattr(self, 'cpu_label'):
+            cpu_percent = round(psutil.cpu_percent(interval=None), 1)
+            if cpu_percent != self._last_cpu:
+                self._last_cpu = cpu_percent
                 self.cpu_label.setText(f"{cpu_percent:.1f}%")
                 
-                # CPU 사용률에 따른 색상 변경
-                if cpu_percent > 80:
-                    self.cpu_label.setStyleSheet("color: #F44336; font-weight: bold;")  # 빨간색
-                elif cpu_percent > 60:
-                    self.cpu_label.setStyleSheet("color: #FF9800; font-weight: bold;")  # 주황색
-                else:
-                    self.cpu_label.setStyleSheet("color: #4CAF50; font-weight: bold;")  # 초록색
+                # CPU 사용률에 따른 색상 변경 (구간이 바뀐 경우만)
+                level = usage_level(cpu_percent, 60, 80)
+                if level != self._last_cpu_level:
+                    self._last_cpu_level = level
+                    self.cpu_label.setPalette(self._usage_palettes[level])
             
             # 메모리 사용률
             memory = psutil.virtual_memory()
             memory_mb = (memory.total - memory.available) / (1024 * 1024)
             memory_percent = memory.percent
-            if hasattr(self, 'memory_label'):
-                self.memory_label.setText(f"{memory_mb:.0f} MB ({memory_percent:.1f}%)")
+            mem_text = f"{memory_mb:.0f} MB ({memory_percent:.1f}%)"
+            if mem_text != self._last_mem_text:
+                self._last_mem_text = mem_text
+                self.perf_memory_label.setText(mem_text)
                 
-                # 메모리 사용률에 따른 색상 변경
-                if memory_percent > 85:
-                    self.memory_label.setStyleSheet("color: #F44336; font-weight: bold;")  # 빨간색
-                elif memory_percent > 70:
-                    self.memory_label.setStyleSheet("color: #FF9800; font-weight: bold;")  # 주황색
-                else:
-                    self.memory_label.setStyleSheet("color: #4CAF50; font-weight: bold;")  # 초록색
+                # 메모리 사용률에 따른 색상 변경 (구간이 바뀐 경우만)
+                level = usage_level(memory_percent, 70, 85)
+                if level != self._last_mem_level:
+                    self._last_mem_level = level
+                    self.perf_memory_label.setPalette(self._usage_palettes[level])
+            
+            # 프로그램 자체 메모리 사용량 (같은 주기에서 함께 갱신)
+            rss_text = f"메모리: {self._process.memory_info().rss / (1024 * 1024):.0f}MB"
+            if rss_text != self._last_rss_text:
+                self._last_rss_text = rss_text
+                self.status_memory_label.setText(rss_text)
                     
         except Exception as e:
             print(f"성능 정보 업데이트 실패: {e}")
@@ -762,11 +988,10 @@ class PDFExtractorGUI(QMainWindow):
         if elapsed_time > 0:
             # 처리 속도 계산
             speed = files_processed / elapsed_time
-            if hasattr(self, 'speed_label'):
-                self.speed_label.setText(f"{speed:.2f} 파일/초")
+            self.perf_speed_label.setText(f"{speed:.2f} 파일/초")
             
             # 예상 완료 시간 계산
-            if speed > 0 and hasattr(self, 'eta_label'):
+            if speed > 0:
                 remaining_files = total_files - files_processed
                 eta_seconds = remaining_files / speed
                 
@@ -781,36 +1006,18 @@ class PDFExtractorGUI(QMainWindow):
                 
                 self.eta_label.setText(eta_text)
             else:
-                if hasattr(self, 'eta_label'):
-                    self.eta_label.setText("계산 중...")
+                self.eta_label.setText("계산 중...")
         else:
-            if hasattr(self, 'speed_label'):
-                self.speed_label.setText("0 파일/초")
-            if hasattr(self, 'eta_label'):
-                self.eta_label.setText("--:--")
+            self.perf_speed_label.setText("0 파일/초")
+            self.eta_label.setText("--:--")
 
     def closeEvent(self, event):
         """애플리케이션 종료 시 설정 저장"""
         self.save_settings()
         super().closeEvent(event)
 
-class HelpDialog(QDialog):
-    """도움말 다이얼로그"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("PDF Extractor 도움말")
-        self.setFixedSize(600, 500)
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """UI 설정"""
-        layout = QVBoxLayout()
-        
-        # 도움말 내용
-        help_text = QTextEdit()
-        help_text.setReadOnly(True)
-        help_text.setHtml("""
+# 도움말 내용
+HELP_HTML = """
         <h2>PDF to Excel Extractor 사용법</h2>
         
         <h3>🔧 기본 사용법</h3>
@@ -824,7 +1031,7 @@ class HelpDialog(QDialog):
         <p><b>추출 방법:</b></p>
         <ul>
             <li><b>camelot:</b> 표 구조가 명확한 PDF에 적합</li>
-            <li><b>tabula:</b> 다양한 형태의 표에 대응</li>
+            <li><b>tabula:</b> 다양한 형태의 표에 대응 (Java 필요, 자동 선택에서는 사용하지 않음)</li>
             <li><b>pdfplumber:</b> 텍스트 기반 표 추출</li>
         </ul>
         <p><b>Ghostscript 사용:</b> 이미지 기반 PDF 처리 시 품질 향상</p>
@@ -844,7 +1051,45 @@ class HelpDialog(QDialog):
         <p>• 처리 중에도 로그를 통해 진행 상황을 확인할 수 있습니다.</p>
         <p>• 설정은 자동으로 저장되어 다음 실행 시 복원됩니다.</p>
         <p>• 대용량 파일 처리 시 성능 모니터를 참고하세요.</p>
-        """)
+        """
+
+# HELP_HTML을 파싱해 둔 문서 (get_help_document에서 최초 1회 생성)
+_help_document = None
+
+
+def get_help_document() -> QTextDocument:
+    """도움말 문서 (HTML 파싱과 레이아웃은 처음 열 때 한 번만 수행)"""
+    global _help_document
+    if _help_document is None:
+        _help_document = QTextDocument()
+        _help_document.setHtml(HELP_HTML)
+    return _help_document
+
+
+class HelpDialog(QDialog):
+    """도움말 다이얼로그"""
+    DIALOG_SIZE = QSize(600, 500)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("PDF Extractor 도움말")
+        self.setMinimumSize(self.sizeHint())
+        self.setMaximumSize(self.sizeHint())
+        self.setup_ui()
+        
+    def sizeHint(self):
+        """고정 크기 (레이아웃 계산 없이 반환)"""
+        return self.DIALOG_SIZE
+        
+    def setup_ui(self):
+        """UI 설정"""
+        layout = QVBoxLayout()
+        
+        # 도움말 내용
+        help_text = QTextEdit()
+        help_text.setReadOnly(True)
+        # 도움말 HTML은 최초 1회만 파싱한 문서를 복제해 사용
+        help_text.setDocument(get_help_document().clone(help_text))
         
         layout.addWidget(help_text)
         
@@ -853,31 +1098,44 @@ class HelpDialog(QDialog):
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
         
+        # 창 크기가 고정이므로 레이아웃이 창 크기 제약을 다시 계산하지 않도록 함
+        layout.setSizeConstraint(QLayout.SetNoConstraint)
         self.setLayout(layout)
+        layout.activate()
 
 class ResultsDialog(QDialog):
     """처리 결과 확인 다이얼로그"""
+    DIALOG_SIZE = QSize(400, 200)
     
     def __init__(self, output_folder: str, processed_files: int, parent=None):
         super().__init__(parent)
-        self.output_folder = output_folder
-        self.processed_files = processed_files
         self.setWindowTitle("처리 완료")
-        self.setFixedSize(400, 200)
+        self.setMinimumSize(self.sizeHint())
+        self.setMaximumSize(self.sizeHint())
         self.setup_ui()
+        self.set_results(output_folder, processed_files)
+        
+    def sizeHint(self):
+        """고정 크기 (레이아웃 계산 없이 반환)"""
+        return self.DIALOG_SIZE
         
     def setup_ui(self):
         """UI 설정"""
         layout = QVBoxLayout()
         
-        # 결과 정보
-        info_label = QLabel(f"""
-        <h3>✅ 처리가 완료되었습니다!</h3>
-        <p><b>처리된 파일:</b> {self.processed_files}개</p>
-        <p><b>출력 폴더:</b> {self.output_folder}</p>
-        """)
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
+        # 제목 (HTML 대신 굵은 글꼴)
+        title_label = QLabel("✅ 처리가 완료되었습니다!")
+        title_font = title_label.font()
+        title_font.setBold(True)
+        title_font.setPointSize(title_font.pointSize() + 2)
+        title_label.setFont(title_font)
+        layout.addWidget(title_label)
+        
+        # 결과 정보 (서식 해석이 필요 없는 일반 텍스트, 내용은 set_results에서 채움)
+        self.info_label = QLabel()
+        self.info_label.setTextFormat(Qt.PlainText)
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
         
         # 버튼들
         button_layout = QHBoxLayout()
@@ -892,36 +1150,47 @@ class ResultsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+        # 창 크기가 고정이므로 레이아웃이 창 크기 제약을 다시 계산하지 않도록 함
+        layout.setSizeConstraint(QLayout.SetNoConstraint)
         self.setLayout(layout)
+        layout.activate()
+        
+    def set_results(self, output_folder: str, processed_files: int):
+        """결과 정보 갱신 (다이얼로그 재사용 시 라벨만 바꿈)"""
+        self.output_folder = output_folder
+        self.processed_files = processed_files
+        self.info_label.setText(f"처리된 파일: {processed_files}개\n출력 폴더: {output_folder}")
         
     def open_folder(self):
-        """결과 폴더 열기"""
-        try:
-            if sys.platform == "win32":
-                os.startfile(self.output_folder)
-            elif sys.platform == "darwin":  # macOS
-                os.system(f"open '{self.output_folder}'")
-            else:  # Linux
-                os.system(f"xdg-open '{self.output_folder}'")
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"폴더를 열 수 없습니다: {e}")
+        """결과 폴더 열기 (플랫폼 기본 파일 관리자에 비동기로 요청)"""
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(self.output_folder)):
+            QMessageBox.warning(self, "오류", f"폴더를 열 수 없습니다: {self.output_folder}")
 
 
 def main():
     """메인 함수"""
-    app = QApplication(sys.argv)
+    # 초기화 방식에 영향을 주는 속성은 QApplication 생성 전에 설정해야 적용됨
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
     
     # 애플리케이션 정보 설정
-    app.setApplicationName("PDF to Excel Extractor")
-    app.setApplicationVersion("0.0.1")
-    app.setOrganizationName("PDF Extractor")
+    QApplication.setApplicationName("PDF to Excel Extractor")
+    QApplication.setApplicationVersion("0.0.1")
+    QApplication.setOrganizationName("PDF Extractor")
+    
+    app = QApplication(sys.argv)
     
     # 메인 윈도우 생성 및 표시
     window = PDFExtractorGUI()
     window.show()
     
+    # 창이 그려진 뒤 추출 백엔드 로드 시작
+    QTimer.singleShot(0, window.kick_off_backend_load)
+    
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 실행 파일에서 작업 프로세스 시작용
     main()
@@ -6,30 +6,304 @@ PDF에서 데이터를 추출하여 Excel로 변환하는 핵심 모듈
 """
 
 import os
+import sys
+import io
+import re
 import pandas as pd
+import openpyxl
 import pdfplumber
-import camelot
-import tabula
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Tuple
+from typing import List, Dict, Optional, Union, Tuple, Callable
 import logging
 import traceback
-import cv2
 import numpy as np
-from PIL import Image
-import pytesseract
-import easyocr
 import tempfile
+import shutil
 import psutil  # 메모리 모니터링
 import gc      # 가비지 컬렉션
 import time    # 성능 측정
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from contextlib import contextmanager
+from itertools import groupby
 
 # Ghostscript 경로 설정 (macOS Homebrew)
 if '/opt/homebrew/bin' not in os.environ.get('PATH', ''):
     os.environ['PATH'] = '/opt/homebrew/bin:' + os.environ.get('PATH', '')
 
 
+# xlsxwriter 설치 여부 (없으면 openpyxl로 저장)
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
+# 자동 선택 모드에서 페이지 유형별로 시도할 추출 방법 (빠른 순서)
+# pymupdf(find_tables 기본 'lines' 전략), pdfplumber, camelot lattice는 모두 괘선으로 테이블을 찾으므로
+# 괘선이 없는 페이지에는 글자 정렬로 테이블을 찾는 pymupdf_text(find_tables 'text' 전략)를 사용하고,
+# 텍스트 없는 스캔 페이지는 OCR 옵션(extract_data_range)으로만 처리.
+# tabula(stream)는 호출마다 JVM을 띄우므로(수 초, 수백 MB) 자동 모드에서는 쓰지 않고 직접 선택한 경우에만 실행
+AUTO_METHODS = {
+    'ruled': ('pymupdf', 'pdfplumber', 'camelot'),
+    'unruled': ('pymupdf_text',),
+    'scanned': (),
+}
+
+# 페이지 유형이 섞였거나 판별에 실패한 범위에서 시도할 방법 (모든 유형의 합집합)
+AUTO_FALLBACK_METHODS = ('pymupdf', 'pdfplumber', 'camelot', 'pymupdf_text')
+
+# OCR을 함께 실행할 페이지 범위의 최대 크기
+OCR_RANGE_MAX_PAGES = 10
+
+# 페이지 유형 판별 기준 (괘선으로 볼 선/사각형 최소 개수, 텍스트 페이지로 볼 최소 글자 수)
+RULING_MIN_SEGMENTS = 4
+TEXT_MIN_CHARS = 20
+
+# OCR용 페이지 렌더링 기본 해상도 (72dpi의 1.5배, 옵션 'ocr_dpi'로 변경)
+OCR_DPI = 108
+
+# OCR 텍스트에서 표의 열 구분 (탭과 그 주변 공백, 또는 2칸 이상 연속 공백)
+_CELL_SEPARATOR = re.compile(r'\s*\t\s*| {2,}')
+
+# camelot_flavor='lattice_fast'에서 같은 선으로 묶을 좌표 허용 오차 (pt)
+LATTICE_SNAP_TOLERANCE = 2.0
+
+# 배치마다 하는 메모리 측정/로그의 최소 간격 (초, 이 간격 안에서는 직전 측정값 재사용·로그 생략)
+MEMORY_SAMPLE_INTERVAL = 2.0
+
+# 배치 후 가비지 컬렉션 기준: 직전 수거 이후 RSS가 이만큼(MB) 늘었을 때만 수거,
+# 수거할 때는 1세대까지만 보고 GC_FULL_EVERY번째마다 전체(2세대) 수거
+GC_RSS_GROWTH_MB = 256
+GC_FULL_EVERY = 4
+
+# 이 크기 이하의 PDF는 한 번 메모리로 읽어 PyMuPDF/pdfplumber가 같은 바이트를 사용 (초과 시 경로로 열기)
+PDF_IN_MEMORY_MAX_MB = 200
+
+# 긴 배치 작업의 메모리 단편화를 줄이는 대체 할당자 (LD_PRELOAD/DYLD_INSERT_LIBRARIES로 주입)
+PRELOAD_ALLOCATORS = ('jemalloc', 'mimalloc')
+_allocator_checked = False
+
+
+def check_preloaded_allocator(logger: Optional[logging.Logger] = None) -> bool:
+    """jemalloc/mimalloc이 미리 로드되어 있는지 확인하고, 아니면 한 번만 안내 로그를 남김
+    
+    GUI 프로세스에서 한 번만 호출 (작업 프로세스나 PDFExtractor 생성마다 호출하지 않음).
+    Windows에는 LD_PRELOAD에 해당하는 방법이 없으므로 확인하지 않음
+    """
+    global _allocator_checked
+    if sys.platform == 'win32':
+        return False
+    preload = os.environ.get('LD_PRELOAD', '') + os.environ.get('DYLD_INSERT_LIBRARIES', '')
+    loaded = any(name in preload for name in PRELOAD_ALLOCATORS)
+    if loaded or _allocator_checked:
+        return loaded
+    _allocator_checked = True
+    
+    if sys.platform == 'darwin':
+        hint = 'DYLD_INSERT_LIBRARIES=$(brew --prefix jemalloc)/lib/libjemalloc.dylib'
+    else:
+        hint = 'LD_PRELOAD=/usr/lib/x86_64-linux-gnu/libjemalloc.so.2'
+    (logger or logging.getLogger(__name__)).info(
+        f"jemalloc/mimalloc이 로드되지 않았습니다. 대용량 배치 작업 시 메모리 단편화를 줄이려면 "
+        f"'{hint}' 환경변수와 함께 실행하세요 (libmimalloc 경로도 사용 가능)"
+    )
+    return False
+
+
+# tabula 실행에 필요한 java 경로 (최초 확인 결과를 저장, 없으면 '')
+_java_path = None
+
+
+def java_available() -> bool:
+    """tabula가 쓸 java 실행 파일이 있는지 (한 번만 확인)"""
+    global _java_path
+    if _java_path is None:
+        _java_path = shutil.which('java') or ''
+    return bool(_java_path)
+
+
+def _snap_coordinates(values: List[float], tol: float) -> np.ndarray:
+    """정렬한 좌표를 간격이 tol 이하인 것끼리 묶어 각 묶음의 평균으로 반환"""
+    if not values:
+        return np.array([])
+    coords = np.sort(np.asarray(values, dtype=float))
+    groups = np.split(coords, np.flatnonzero(np.diff(coords) > tol) + 1)
+    return np.array([group.mean() for group in groups])
+
+
+def unique_sheet_name(name: str, used: set) -> str:
+    """Excel 시트 이름 생성 (허용하지 않는 문자는 '_'로, 31자 제한, used에 이미 있으면 _2, _3 ... 추가)
+    
+    used: 지금까지 쓴 시트 이름(소문자) 집합 - 반환한 이름도 여기에 추가됨
+    """
+    base_name = re.sub(r'[\[\]:*?/\\]', '_', name)[:31] or "PDF"
+    sheet_name = base_name
+    n = 2
+    while sheet_name.lower() in used:
+        suffix = f"_{n}"
+        sheet_name = base_name[:31 - len(suffix)] + suffix
+        n += 1
+    used.add(sheet_name.lower())
+    return sheet_name
+
+
+def excel_output_path(pdf_path: Union[str, Path], output_dir: Union[str, Path]) -> Path:
+    """extract_to_excel이 PDF 1개의 결과를 저장하는 Excel 파일 경로 ({파일 이름}_extracted.xlsx)"""
+    return Path(output_dir) / f"{Path(pdf_path).stem}_extracted.xlsx"
+
+
+def read_pdf_bytes(pdf_path: str) -> Optional[bytes]:
+    """PDF_IN_MEMORY_MAX_MB 이하인 PDF 파일 내용을 한 번에 읽음 (크거나 읽을 수 없으면 None)"""
+    try:
+        if os.path.getsize(pdf_path) > PDF_IN_MEMORY_MAX_MB * 1024 * 1024:
+            return None
+        return Path(pdf_path).read_bytes()
+    except OSError:
+        return None
+
+
+def open_pdf_document(pdf_path: str, pdf_bytes: Optional[bytes] = None) -> fitz.Document:
+    """메모리에 읽어 둔 내용이 있으면 그것으로, 없으면 경로로 PyMuPDF 문서 열기"""
+    if pdf_bytes is not None:
+        return fitz.open(stream=pdf_bytes, filetype='pdf')
+    return fitz.open(pdf_path)
+
+
+class ExcelTableWriter:
+    """추출된 테이블을 배치가 끝날 때마다 바로 Excel에 쓰는 작성기
+    
+    테이블을 모두 모아 두지 않으므로 메모리에는 배치 하나 분량만 남음.
+    파일은 첫 쓰기 때 열고 (데이터가 없으면 파일을 만들지 않음), 행을 쓰는 즉시 디스크로 내보냄
+    (openpyxl은 write-only 통합 문서, xlsxwriter는 constant_memory) - 그래서 시트별로 행을 위에서 아래로만 씀.
+    DataFrame.to_excel을 거치지 않고 itertuples로 얻은 행을 그대로 기록
+    """
+    
+    def __init__(self, output_path: str, options: dict, logger: logging.Logger):
+        self.output_path = output_path
+        self.separate_sheets = options.get('separate_sheets', False)
+        self.include_text = options.get('include_text', False)
+        self.logger = logger
+        
+        self.engine = options.get('excel_engine', 'openpyxl')
+        if self.engine == 'xlsxwriter' and not XLSXWRITER_AVAILABLE:
+            self.engine = 'openpyxl'
+        
+        self._book = None    # 첫 쓰기 때 생성
+        self._sheets = {}    # 시트 이름 → (워크시트, 지금까지 쓴 행 수)
+        self._next_row = {}  # 시트 이름 → 다음에 쓸 행
+        self.tables_saved = 0
+        
+    @property
+    def has_output(self) -> bool:
+        """기록한 데이터가 있는지 (없으면 파일도 만들어지지 않음)"""
+        return self._book is not None
+        
+    def _append_rows(self, sheet_name: str, start_row: int, rows):
+        """시트의 start_row(0부터)부터 행을 차례로 기록"""
+        if self._book is None:
+            if self.engine == 'xlsxwriter':
+                import xlsxwriter
+                self._book = xlsxwriter.Workbook(self.output_path, {'constant_memory': True})
+            else:
+                self._book = openpyxl.Workbook(write_only=True)
+        
+        if sheet_name in self._sheets:
+            sheet, written = self._sheets[sheet_name]
+        elif self.engine == 'xlsxwriter':
+            sheet, written = self._book.add_worksheet(sheet_name), 0
+        else:
+            sheet, written = self._book.create_sheet(sheet_name), 0
+        
+        if self.engine == 'xlsxwriter':
+            written = max(written, start_row)  # 건너뛴 행은 빈 행으로 남음
+            for row in rows:
+                sheet.write_row(written, 0, row)
+                written += 1
+        else:
+            for _ in range(start_row - written):
+                sheet.append([])  # 테이블 사이 빈 행
+            written = max(written, start_row)
+            for row in rows:
+                sheet.append(row)
+                written += 1
+        self._sheets[sheet_name] = (sheet, written)
+        
+    @staticmethod
+    def _table_rows(df: pd.DataFrame):
+        """헤더 + 데이터 행 (빈 값은 빈 셀이 되도록 None으로)"""
+        yield [None if pd.isna(col) else str(col) for col in df.columns]
+        yield from df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        
+    def write_tables(self, tables: List[Dict], sheet_name: Optional[str] = None):
+        """테이블 목록을 페이지 순서대로 이어서 기록 (separate_sheets면 페이지별 시트, 아니면 'Tables' 시트 하나)
+        
+        sheet_name: 지정하면 모든 테이블을 그 시트에 메타데이터 행과 함께 기록 (여러 PDF를 한 통합 문서에 모을 때)
+        """
+        target_sheet = sheet_name
+        for table_info in tables:
+            try:
+                df = table_info['data']
+                if not isinstance(df, pd.DataFrame) or df.empty:
+                    continue
+                    
+                if self.separate_sheets and target_sheet is None:
+                    # 페이지별 시트 분리 (시트 이름 길이 제한: Excel 제한사항)
+                    sheet_name = f"Page_{table_info['page']}"[:31]
+                    start_row = self._next_row.get(sheet_name, 0)
+                else:
+                    # 모든 테이블을 하나의 시트에, 테이블마다 메타데이터 행 추가
+                    sheet_name = target_sheet or "Tables"
+                    start_row = self._next_row.get(sheet_name, 0)
+                    self._append_rows(sheet_name, start_row,
+                                      [[f"페이지 {table_info['page']} - {table_info['method']}"]])
+                    start_row += 1
+                
+                self._append_rows(sheet_name, start_row, self._table_rows(df))
+                self._next_row[sheet_name] = start_row + len(df) + 2  # 2행 간격
+                self.tables_saved += 1
+                
+            except Exception as e:
+                self.logger.warning(f"테이블 저장 실패 (페이지 {table_info.get('page')}): {str(e)}")
+                
+    def write_text(self, text_items: List[Dict], sheet_name: str = "Text"):
+        """텍스트 블록을 시트(기본 'Text')의 마지막 기록 아래에 이어서 기록 (include_text 옵션일 때만)"""
+        if not text_items or not self.include_text:
+            return
+        try:
+            start_row = self._next_row.get(sheet_name, 0)
+            self._append_rows(sheet_name, start_row, [('Page', 'Content')])
+            self._append_rows(sheet_name, start_row + 1, (
+                (text_info['page'], text_info['content'][:32000])  # Excel 셀 크기 제한
+                for text_info in text_items
+            ))
+            self._next_row[sheet_name] = start_row + len(text_items) + 2
+            self.logger.info(f"{len(text_items)}개 텍스트 블록이 저장되었습니다.")
+        except Exception as e:
+            self.logger.warning(f"텍스트 저장 실패: {str(e)}")
+            
+    def close(self):
+        """파일 저장 마무리"""
+        if self._book is None:
+            return
+        if self.engine == 'xlsxwriter':
+            self._book.close()
+        else:
+            self._book.save(self.output_path)
+        self._book = None
+        self._sheets = {}
+        self.logger.info(f"{self.tables_saved}개 테이블이 저장되었습니다.")
+            
+    def abort(self):
+        """저장을 포기하고 불완전한 파일을 남기지 않음 (openpyxl은 save 전까지 파일을 만들지 않음)"""
+        if self._book is not None and self.engine == 'xlsxwriter':
+            try:
+                self._book.close()  # 닫지 않은 xlsxwriter 통합 문서는 소멸 시 경고를 남기므로 닫은 뒤 삭제
+                os.remove(self.output_path)
+            except Exception:
+                pass
+        self._book = None
+        self._sheets = {}
+
+
 class PDFExtractor:
     """PDF 데이터 추출 클래스"""
     
@@ -37,6 +311,21 @@ class PDFExtractor:
         self.logger = logging.getLogger(__name__)
         self.setup_logging()
         self.process = psutil.Process()  # 현재 프로세스 모니터링
+        self._memory_sample = (0.0, None)  # (측정 시각, 측정값) - get_memory_usage(max_age) 캐시
+        self._last_memory_log = 0.0
+        self._rss_at_last_gc = 0.0
+        self._gc_runs = 0
+        
+        # extract_to_excel 동안 배치와 추출기가 함께 쓰는 열린 문서 (파일당 한 번만 열기)
+        self._session_path = None
+        self._pdf_bytes = None
+        self._doc = None
+        self._plumber = None
+        
+        # EasyOCR 리더 (모델 로드가 느리므로 처음 필요할 때 한 번만 생성해 파일·배치 간 재사용)
+        self._easyocr_reader = None
+        # torch(EasyOCR) import 전에 설정해야 적용됨: GPU 메모리를 확장 가능한 세그먼트로 할당해 단편화/OOM 완화
+        os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:True')
         
     def setup_logging(self):
         """로깅 설정"""
@@ -45,13 +334,18 @@ class PDFExtractor:
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         
-    def get_memory_usage(self) -> Dict[str, float]:
-        """현재 메모리 사용량 반환 (MB 단위)"""
+    def get_memory_usage(self, max_age: float = 0.0) -> Dict[str, float]:
+        """현재 메모리 사용량 반환 (MB 단위, max_age초 이내에 측정한 값이 있으면 그대로 반환)"""
+        now = time.monotonic()
+        sampled_at, memory = self._memory_sample
+        if memory is not None and now - sampled_at < max_age:
+            return memory
+        
         try:
             memory_info = self.process.memory_info()
             system_memory = psutil.virtual_memory()
             
-            return {
+            memory = {
                 'used_mb': memory_info.rss / 1024 / 1024,
                 'available_mb': system_memory.available / 1024 / 1024,
                 'total_mb': system_memory.total / 1024 / 1024,
@@ -59,16 +353,34 @@ class PDFExtractor:
             }
         except Exception:
             return {'used_mb': 0, 'available_mb': 0, 'total_mb': 0, 'percent': 0}
+        
+        self._memory_sample = (now, memory)
+        return memory
     
-    def log_memory_status(self, operation: str = ""):
-        """메모리 상태 로깅"""
+    def log_memory_status(self, operation: str = "", force: bool = False):
+        """메모리 상태 로깅 (force가 아니면 MEMORY_SAMPLE_INTERVAL마다 최대 한 번)"""
+        now = time.monotonic()
+        if not force and now - self._last_memory_log < MEMORY_SAMPLE_INTERVAL:
+            return
+        self._last_memory_log = now
+        
         memory = self.get_memory_usage()
         self.logger.info(f"[메모리] {operation} - 사용: {memory['used_mb']:.1f}MB, "
                         f"시스템 사용률: {memory['percent']:.1f}%")
     
     def cleanup_memory(self):
-        """메모리 정리"""
-        gc.collect()
+        """메모리 정리 (RSS가 GC_RSS_GROWTH_MB 이상 늘었을 때만 수거, 전체 힙 순회는 가끔만)"""
+        used_mb = self.get_memory_usage(max_age=MEMORY_SAMPLE_INTERVAL)['used_mb']
+        if used_mb - self._rss_at_last_gc >= GC_RSS_GROWTH_MB:
+            self._gc_runs += 1
+            gc.collect(2 if self._gc_runs % GC_FULL_EVERY == 0 else 1)
+            self._rss_at_last_gc = self.get_memory_usage()['used_mb']
+        
+        # EasyOCR가 잡아 둔 GPU 캐시 반환 (torch를 이미 불러온 경우에만, 여기서 새로 import하지 않음)
+        torch = sys.modules.get('torch')
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
         self.log_memory_status("메모리 정리 후")
     
     def get_pdf_info(self, pdf_path: str) -> Dict:
@@ -94,34 +406,81 @@ class PDFExtractor:
                 'file_size_mb': os.path.getsize(pdf_path) / (1024 * 1024) if os.path.exists(pdf_path) else 0
             }
         
-    def extract_to_excel(self, pdf_path: str, output_dir: str, options: dict, password: str = None) -> bool:
-        """PDF에서 데이터를 추출하여 Excel 파일로 저장 (안정성 개선)"""
+    def extract_to_excel(self, pdf_path: str, output_dir: str, options: dict, password: str = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         doc: Optional[fitz.Document] = None, pdf_bytes: Optional[bytes] = None) -> bool:
+        """PDF에서 데이터를 추출하여 Excel 파일로 저장 (안정성 개선)
+        
+        doc: 호출자가 이미 연 문서 (닫기는 호출자 책임). 없으면 여기서 한 번 열고,
+        추출이 끝날 때까지 모든 배치와 PyMuPDF/OCR 추출기가 같은 문서를 사용
+        pdf_bytes: 호출자가 이미 읽은 파일 내용. 없으면 read_pdf_bytes로 한 번 읽어
+        PyMuPDF와 pdfplumber가 파일을 다시 열지 않고 같은 바이트를 사용
+        """
+        with self._session(pdf_path, doc, pdf_bytes):
+            return self._extract_to_excel(pdf_path, output_dir, options, password, progress_callback)
+    
+    @contextmanager
+    def _session(self, pdf_path: str, doc: Optional[fitz.Document] = None, pdf_bytes: Optional[bytes] = None):
+        """파일 하나를 추출하는 동안 열린 문서를 배치·추출기가 공유하도록 설정 (끝나면 직접 연 것만 닫음)"""
+        if pdf_bytes is None:
+            pdf_bytes = read_pdf_bytes(pdf_path)
+        
+        owns_doc = doc is None
+        if owns_doc:
+            try:
+                doc = open_pdf_document(pdf_path, pdf_bytes)
+            except Exception:
+                doc = None  # 열 수 없으면 각 추출기가 경로로 직접 처리
+        
+        self._session_path = pdf_path
+        self._pdf_bytes = pdf_bytes
+        self._doc = doc
+        try:
+            yield doc
+        finally:
+            self._session_path = None
+            self._pdf_bytes = None
+            self._doc = None
+            if self._plumber is not None:
+                self._plumber.close()
+                self._plumber = None
+            if owns_doc and doc is not None:
+                doc.close()
+    
+    def _extract_to_excel(self, pdf_path: str, output_dir: str, options: dict, password: Optional[str],
+                          progress_callback: Optional[Callable[[int, int], None]]) -> bool:
+        """extract_to_excel 본체 (self._doc이 열린 상태에서 호출)"""
+        doc = self._doc
         try:
-            pdf_name = Path(pdf_path).stem
-            output_path = os.path.join(output_dir, f"{pdf_name}_extracted.xlsx")
+            pdf_file = Path(pdf_path)
+            output_path = str(excel_output_path(pdf_file, output_dir))
             
             self.logger.info(f"PDF 처리 시작: {pdf_path}")
             
-            # PDF 파일 체크
-            if not os.path.exists(pdf_path):
+            # PDF 파일 체크 (stat 1회로 존재 여부와 크기 확인)
+            try:
+                file_stat = pdf_file.stat()
+            except FileNotFoundError:
                 self.logger.error(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
                 return False
                 
             # 암호 보호된 PDF 처리
-            if self.is_password_protected(pdf_path):
+            needs_pass = doc.needs_pass if doc is not None else self.is_password_protected(pdf_path)
+            if needs_pass:
                 if password is None:
                     self.logger.error("PDF 파일이 암호로 보호되어 있습니다. 암호를 제공해주세요.")
                     return False
                 
-                # 암호 유효성 검증
-                if not self.verify_password(pdf_path, password):
+                # 암호 유효성 검증 (열린 문서가 있으면 그 문서를 인증해 이후 추출에 사용)
+                valid = doc.authenticate(password) if doc is not None else self.verify_password(pdf_path, password)
+                if not valid:
                     self.logger.error("제공된 암호가 올바르지 않습니다.")
                     return False
                 
                 self.logger.info("암호 인증 성공")
                 
             # 파일 크기 체크 (100MB 이상이면 경고)
-            file_size = os.path.getsize(pdf_path) / (1024 * 1024)  # MB
+            file_size = file_stat.st_size / (1024 * 1024)  # MB
             if file_size > 100:
                 self.logger.warning(f"대용량 PDF 파일 ({file_size:.1f}MB). 처리 시간이 오래 걸릴 수 있습니다.")
             
@@ -134,15 +493,23 @@ class PDFExtractor:
             if max_pages == 0 or max_pages is None:
                 max_pages = 500  # 0이나 None인 경우 기본값 사용
             
-            # 데이터 추출 (배치 처리)
-            extracted_data = self.extract_data_batch(pdf_path, method, options, max_pages)
-            
-            if not extracted_data or (not extracted_data['tables'] and not extracted_data['text']):
-                self.logger.warning("추출된 데이터가 없습니다.")
-                return False
+            # 데이터 추출 (배치 처리) - 테이블은 배치가 끝날 때마다 바로 Excel에 기록
+            table_writer = ExcelTableWriter(output_path, options, self.logger)
+            saved = False
+            try:
+                extracted_data = self.extract_data_batch(pdf_path, method, options, max_pages, progress_callback, doc,
+                                                         table_sink=table_writer.write_tables, password=password)
+                table_writer.write_text(extracted_data['text'])
                 
-            # Excel 파일로 저장
-            self.save_to_excel(extracted_data, output_path, options)
+                if not table_writer.has_output:
+                    self.logger.warning("추출된 데이터가 없습니다.")
+                    return False
+                    
+                table_writer.close()
+                saved = True
+            finally:
+                if not saved:
+                    table_writer.abort()
             
             self.logger.info(f"Excel 파일 생성 완료: {output_path}")
             return True
@@ -155,8 +522,66 @@ class PDFExtractor:
             self.logger.error(traceback.format_exc())
             return False
             
-    def extract_data_batch(self, pdf_path: str, method: str, options: dict, max_pages: int = 500) -> Dict:
-        """대용량 PDF를 배치로 처리하여 데이터 추출"""
+    def extract_batch_to_excel(self, pdf_paths: List[str], output_path: str, options: dict) -> Dict[str, bool]:
+        """여러 PDF를 Excel 파일 하나에 저장 (PDF마다 시트 1개) → {경로: 성공 여부}
+        
+        통합 문서를 한 번만 만들고 저장하므로 작은 파일이 많을 때 파일별 저장 비용이 없음.
+        암호로 보호된 PDF는 건너뜀. 라이브러리/벤치마크용 (GUI는 파일별 extract_to_excel 사용,
+        performance_test.py --one-workbook에서 사용)
+        """
+        method = options.get('method', '자동 선택')
+        max_pages = options.get('max_pages', 500) or 500
+        table_writer = ExcelTableWriter(output_path, options, self.logger)
+        sheet_names = set()
+        results = {}
+        
+        try:
+            for pdf_path in pdf_paths:
+                sheet_name = unique_sheet_name(Path(pdf_path).stem, sheet_names)
+                
+                self.logger.info(f"PDF 처리 시작: {pdf_path} → 시트 {sheet_name}")
+                saved_before = table_writer.tables_saved
+                try:
+                    with self._session(pdf_path) as doc:
+                        if doc is not None and doc.needs_pass:
+                            self.logger.error(f"암호로 보호된 PDF는 일괄 저장에서 건너뜁니다: {pdf_path}")
+                            results[pdf_path] = False
+                            continue
+                        extracted_data = self.extract_data_batch(
+                            pdf_path, method, options, max_pages, doc=doc,
+                            table_sink=partial(table_writer.write_tables, sheet_name=sheet_name)
+                        )
+                    table_writer.write_text(extracted_data['text'], sheet_name=sheet_name)
+                    results[pdf_path] = table_writer.tables_saved > saved_before or bool(extracted_data['text'])
+                except Exception as e:
+                    self.logger.error(f"PDF 추출 오류: {pdf_path} ({str(e)})")
+                    results[pdf_path] = False
+                    
+            if table_writer.has_output:
+                table_writer.close()
+                self.logger.info(f"Excel 파일 생성 완료: {output_path}")
+            else:
+                self.logger.warning("추출된 데이터가 없습니다.")
+        except Exception as e:
+            self.logger.error(f"Excel 파일 저장 실패: {str(e)}")
+            table_writer.abort()
+            return dict.fromkeys(pdf_paths, False)
+            
+        return results
+        
+    def extract_data_batch(self, pdf_path: str, method: str, options: dict, max_pages: int = 500,
+                           progress_callback: Optional[Callable[[int, int], None]] = None,
+                           doc: Optional[fitz.Document] = None,
+                           table_sink: Optional[Callable[[List[Dict]], None]] = None,
+                           password: Optional[str] = None) -> Dict:
+        """대용량 PDF를 배치로 처리하여 데이터 추출 (배치마다 progress_callback(처리한 페이지, 전체 페이지) 호출)
+        
+        table_sink: 배치마다 그 배치의 테이블 목록을 페이지 순서대로 넘겨받는 함수.
+        지정하면 테이블을 결과에 모으지 않음 (ExcelTableWriter.write_tables로 바로 기록)
+        password: 암호 보호된 PDF의 암호 (batch_processes 작업 프로세스가 문서를 열 때 인증에 사용)
+        """
+        if doc is None:
+            doc = self._session_doc(pdf_path)
         extracted_data = {
             'tables': [],
             'text': [],
@@ -165,11 +590,14 @@ class PDFExtractor:
         
         try:
             # 시작 시 메모리 상태 로깅
-            self.log_memory_status("추출 시작")
+            self.log_memory_status("추출 시작", force=True)
             
-            # PDF 페이지 수 확인
-            with fitz.open(pdf_path) as doc:
-                total_pages = len(doc)
+            # PDF 페이지 수 확인 (이미 열린 문서가 있으면 다시 열지 않음)
+            if doc is not None:
+                total_pages = doc.page_count
+            else:
+                with fitz.open(pdf_path) as pdf_doc:
+                    total_pages = pdf_doc.page_count
             
             self.logger.info(f"총 페이지 수: {total_pages}")
             
@@ -179,35 +607,50 @@ class PDFExtractor:
             
             # 배치 크기 설정 (메모리 효율성)
             batch_size = options.get('batch_size', min(50, total_pages))  # 기본 50페이지 또는 사용자 설정값
+            page_ranges = [
+                (start_page, min(start_page + batch_size, total_pages))
+                for start_page in range(0, total_pages, batch_size)
+            ]
             
-            for start_page in range(0, total_pages, batch_size):
-                end_page = min(start_page + batch_size, total_pages)
-                self.logger.info(f"페이지 {start_page + 1}-{end_page} 처리 중...")
-                
-                # 배치 시작 시 메모리 체크
-                memory = self.get_memory_usage()
-                if memory['percent'] > 85:  # 시스템 메모리 85% 이상 사용 시 경고
-                    self.logger.warning(f"높은 메모리 사용률 감지: {memory['percent']:.1f}%")
-                    
-                try:
-                    # 배치별 처리
-                    batch_data = self.extract_data_range(pdf_path, method, options, start_page, end_page)
-                    
-                    # 결과 통합
-                    if batch_data['tables']:
-                        extracted_data['tables'].extend(batch_data['tables'])
-                    if batch_data['text']:
+            # batch_processes > 1이면 배치를 작업 프로세스로 병렬 처리 (pdfplumber 등 순수 파이썬 파싱도 병렬화)
+            processes = min(options.get('batch_processes', 1), len(page_ranges))
+            if processes > 1:
+                executor = ProcessPoolExecutor(
+                    max_workers=processes, initializer=_init_batch_worker, initargs=(pdf_path, password)
+                )
+                batch_results = executor.map(
+                    partial(_extract_batch_in_worker, pdf_path, method, options),
+                    [start_page for start_page, _ in page_ranges],
+                    [end_page for _, end_page in page_ranges]
+                )
+            else:
+                # 같은 프로세스에서 추출할 때 table_sink가 있으면 기록 후 정리하므로 배치 안에서는 정리하지 않음
+                executor = None
+                batch_results = (
+                    self._extract_batch(pdf_path, method, options, start_page, end_page, cleanup=table_sink is None)
+                    for start_page, end_page in page_ranges
+                )
+            
+            try:
+                # 결과는 페이지 순서대로 통합
+                for (_, end_page), batch_data in zip(page_ranges, batch_results):
+                    if batch_data is not None:
                         extracted_data['text'].extend(batch_data['text'])
-                    
-                    # 배치 완료 후 메모리 정리
-                    self.cleanup_memory()
-                    
-                except Exception as e:
-                    self.logger.error(f"페이지 {start_page + 1}-{end_page} 처리 중 오류: {str(e)}")
-                    continue
+                        if table_sink is not None:
+                            # 테이블을 디스크에 기록한 뒤 참조를 끊고 정리 (RSS가 늘었을 때만 수거, 배치당 한 번)
+                            table_sink(batch_data['tables'])
+                            batch_data = None
+                            self.cleanup_memory()
+                        else:
+                            extracted_data['tables'].extend(batch_data['tables'])
+                    if progress_callback:
+                        progress_callback(end_page, total_pages)
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
                     
             # 최종 메모리 상태 로깅
-            self.log_memory_status("추출 완료")
+            self.log_memory_status("추출 완료", force=True)
             self.logger.info(f"배치 처리 완료. 테이블 {len(extracted_data['tables'])}개, 텍스트 {len(extracted_data['text'])}개 추출")
             
         except Exception as e:
@@ -215,6 +658,35 @@ class PDFExtractor:
             
         return extracted_data
         
+    def _session_doc(self, pdf_path: str) -> Optional[fitz.Document]:
+        """extract_to_excel에서 열어 둔 같은 파일의 문서 (없으면 None)"""
+        return self._doc if self._session_path == pdf_path else None
+        
+    def _extract_batch(self, pdf_path: str, method: str, options: dict, start_page: int, end_page: int,
+                       cleanup: bool = True) -> Optional[Dict]:
+        """배치 1개 추출 (실패 시 None)
+        
+        cleanup: 배치 완료 후 cleanup_memory 호출 여부 (호출자가 결과를 기록한 뒤 정리하면 False)
+        """
+        self.logger.info(f"페이지 {start_page + 1}-{end_page} 처리 중...")
+        
+        # 배치 시작 시 메모리 체크 (짧은 배치가 이어지면 직전 측정값 재사용)
+        memory = self.get_memory_usage(max_age=MEMORY_SAMPLE_INTERVAL)
+        if memory['percent'] > 85:  # 시스템 메모리 85% 이상 사용 시 경고
+            self.logger.warning(f"높은 메모리 사용률 감지: {memory['percent']:.1f}%")
+            
+        try:
+            batch_data = self.extract_data_range(pdf_path, method, options, start_page, end_page)
+            
+            # 배치 완료 후 메모리 정리
+            if cleanup:
+                self.cleanup_memory()
+            return batch_data
+            
+        except Exception as e:
+            self.logger.error(f"페이지 {start_page + 1}-{end_page} 처리 중 오류: {str(e)}")
+            return None
+            
     def extract_data_range(self, pdf_path: str, method: str, options: dict, start_page: int, end_page: int) -> Dict:
         """지정된 페이지 범위에서 데이터 추출"""
         extracted_data = {
@@ -236,7 +708,7 @@ class PDFExtractor:
                 extracted_data = self.extract_with_pymupdf_range(pdf_path, options, start_page, end_page)
                 
             # OCR 사용 시 추가 처리 (페이지 범위 제한)
-            if options.get('use_ocr', False) and end_page - start_page <= 10:  # OCR은 10페이지씩만
+            if options.get('use_ocr', False) and end_page - start_page <= OCR_RANGE_MAX_PAGES:
                 ocr_data = self.extract_with_ocr_range(pdf_path, options, start_page, end_page)
                 if ocr_data['tables']:
                     extracted_data['tables'].extend(ocr_data['tables'])
@@ -252,21 +724,45 @@ class PDFExtractor:
         return self.extract_data_batch(pdf_path, method, options, options.get('max_pages', 500))
         
     def auto_extract_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
-        """지정된 페이지 범위에서 자동으로 최적의 추출 방법 선택"""
-        methods = ['pdfplumber', 'pymupdf', 'tabula', 'camelot']  # 안정성 순서로 정렬
+        """지정된 페이지 범위에서 자동으로 최적의 추출 방법 선택
+        
+        범위의 모든 페이지 유형을 판별하고, 유형이 같은 연속 페이지 구간마다 맞는 방법만 빠른 순서로 시도함
+        (괘선 있는 페이지는 괘선 기반 방법, 괘선 없는 텍스트 페이지는 'text' 전략).
+        유형을 아는 구간은 테이블을 찾은 방법이 나온 뒤 나머지는 실행하지 않고,
+        판별에 실패한 구간은 모든 방법을 실행해 최고 점수를 고름.
+        OCR이 실행되지 않는 범위에서는 스캔 페이지 구간에도 빈 방법 목록을 쓰지 않음
+        """
+        page_types = self._classify_pages(pdf_path, start_page, end_page)
+        ocr_runs = options.get('use_ocr', False) and end_page - start_page <= OCR_RANGE_MAX_PAGES
+        extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        
+        run_start = start_page
+        for page_type, run in groupby(page_types):
+            run_end = run_start + len(list(run))
+            if page_type is None:
+                methods = AUTO_FALLBACK_METHODS
+            else:
+                methods = AUTO_METHODS[page_type] or (() if ocr_runs else AUTO_FALLBACK_METHODS)
+            self.logger.info(f"페이지 {run_start+1}-{run_end} 유형: {page_type or '판별 불가'} → {', '.join(methods) or 'OCR만 사용'}")
+            
+            result = self._auto_extract_run(pdf_path, options, run_start, run_end, methods,
+                                            stop_on_tables=page_type is not None)
+            extracted_data['tables'].extend(result['tables'])
+            extracted_data['text'].extend(result['text'])
+            run_start = run_end
+            
+        return extracted_data
+        
+    def _auto_extract_run(self, pdf_path: str, options: dict, start_page: int, end_page: int,
+                          methods: Tuple[str, ...], stop_on_tables: bool) -> Dict:
+        """auto_extract_range의 한 구간에서 methods를 차례로 실행해 점수가 가장 높은 결과 반환"""
         best_result = {'tables': [], 'text': [], 'metadata': {}}
         best_score = 0
         
         for method in methods:
             try:
-                if method == 'pdfplumber':
-                    result = self.extract_with_pdfplumber_range(pdf_path, options, start_page, end_page)
-                elif method == 'pymupdf':
-                    result = self.extract_with_pymupdf_range(pdf_path, options, start_page, end_page)
-                elif method == 'tabula':
-                    result = self.extract_with_tabula_range(pdf_path, options, start_page, end_page)
-                elif method == 'camelot':
-                    result = self.extract_with_camelot_range(pdf_path, options, start_page, end_page)
+                extract = getattr(self, f"extract_with_{method}_range")
+                result = extract(pdf_path, options, start_page, end_page)
                     
                 # 결과 점수 계산 (테이블 수 + 데이터 품질 + 텍스트)
                 score = len(result['tables']) * 10
@@ -283,6 +779,10 @@ class PDFExtractor:
                     best_score = score
                     best_result = result
                     self.logger.info(f"{method} 방법이 최고 점수 {score}를 기록했습니다.")
+                
+                # 유형이 같은 구간에서 테이블을 찾았으면 더 느린 방법은 시도하지 않음
+                if stop_on_tables and result['tables']:
+                    break
                     
             except Exception as e:
                 self.logger.warning(f"{method} 추출 실패 (페이지 {start_page+1}-{end_page}): {str(e)}")
@@ -290,12 +790,51 @@ class PDFExtractor:
                 
         return best_result
         
+    def _classify_pages(self, pdf_path: str, start_page: int, end_page: int) -> List[Optional[str]]:
+        """범위의 페이지를 PyMuPDF로 살펴 페이지별 유형 판별 ('ruled', 'unruled', 'scanned', 실패 시 None)"""
+        page_types = []
+        try:
+            shared_doc = self._session_doc(pdf_path)
+            doc = shared_doc if shared_doc is not None else fitz.open(pdf_path)
+            try:
+                for page_num in range(start_page, end_page):
+                    page = doc.load_page(page_num)
+                    text_chars = len(page.get_text().strip())
+                    has_images = bool(page.get_images())
+                    segments = sum(
+                        1 for drawing in page.get_drawings()
+                        for item in drawing['items'] if item[0] in ('l', 're')
+                    )
+                    if text_chars < TEXT_MIN_CHARS:
+                        page_types.append('scanned' if has_images else 'unruled')
+                    else:
+                        page_types.append('ruled' if segments >= RULING_MIN_SEGMENTS else 'unruled')
+            finally:
+                if doc is not shared_doc:
+                    doc.close()
+        except Exception as e:
+            self.logger.warning(f"페이지 유형 판별 실패 (페이지 {start_page + len(page_types) + 1}): {str(e)}")
+            page_types.extend([None] * (end_page - start_page - len(page_types)))  # 판별하지 못한 나머지 페이지
+        
+        return page_types
+        
     def extract_with_pdfplumber_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
         """pdfplumber를 사용한 페이지 범위 추출"""
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        include_text = options.get('include_text', False)
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            # 같은 파일은 extract_to_excel 동안 한 번만 열어 배치 간 공유
+            if self._session_path == pdf_path:
+                if self._plumber is None:
+                    source = io.BytesIO(self._pdf_bytes) if self._pdf_bytes is not None else pdf_path
+                    self._plumber = pdfplumber.open(source)
+                pdf = self._plumber
+            else:
+                pdf = pdfplumber.open(pdf_path)
+            try:
                 for page_num in range(start_page, min(end_page, len(pdf.pages))):
                     try:
                         page = pdf.pages[page_num]
@@ -305,15 +844,9 @@ class PDFExtractor:
                         for table in tables:
                             try:
                                 table_data = table.extract()
-                                if table_data and len(table_data) >= options.get('min_rows', 2):
-                                    # 헤더가 있는지 확인
-                                    if len(table_data) > 1:
-                                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                                    else:
-                                        df = pd.DataFrame(table_data)
-                                    
-                                    df = self.clean_dataframe(df)
-                                    if len(df.columns) >= options.get('min_cols', 2):
+                                if table_data and len(table_data) >= min_rows:
+                                    df = self.table_to_dataframe(table_data)
+                                    if len(df.columns) >= min_cols:
                                         extracted_data['tables'].append({
                                             'data': df,
                                             'page': page_num + 1,
@@ -323,7 +856,7 @@ class PDFExtractor:
                                 self.logger.warning(f"테이블 추출 실패 (페이지 {page_num + 1}): {str(e)}")
                                 
                         # 텍스트 추출
-                        if options.get('include_text', False):
+                        if include_text:
                             try:
                                 text = page.extract_text()
                                 if text and text.strip():
@@ -333,50 +866,29 @@ class PDFExtractor:
                                     })
                             except Exception as e:
                                 self.logger.warning(f"텍스트 추출 실패 (페이지 {page_num + 1}): {str(e)}")
+                            
+                        # 공유 문서는 배치가 끝나도 열려 있으므로 페이지별 파싱 캐시는 바로 비움
+                        page.close()
                                 
                     except Exception as e:
                         self.logger.warning(f"페이지 {page_num + 1} 처리 실패: {str(e)}")
                         continue
                         
+            finally:
+                if pdf is not self._plumber:
+                    pdf.close()
+                        
         except Exception as e:
             self.logger.error(f"PDFPlumber 페이지 범위 추출 실패: {str(e)}")
             
         return extracted_data
-        """자동으로 최적의 추출 방법 선택"""
-        methods = ['pdfplumber', 'camelot', 'tabula', 'pymupdf']
-        best_result = {'tables': [], 'text': [], 'metadata': {}}
-        best_score = 0
-        
-        for method in methods:
-            try:
-                if method == 'pdfplumber':
-                    result = self.extract_with_pdfplumber(pdf_path, options)
-                elif method == 'camelot':
-                    result = self.extract_with_camelot(pdf_path, options)
-                elif method == 'tabula':
-                    result = self.extract_with_tabula(pdf_path, options)
-                elif method == 'pymupdf':
-                    result = self.extract_with_pymupdf(pdf_path, options)
-                    
-                # 결과 점수 계산 (테이블 수 + 데이터 품질)
-                score = len(result['tables']) * 10
-                for table in result['tables']:
-                    if isinstance(table, pd.DataFrame):
-                        score += len(table) * len(table.columns)
-                        
-                if score > best_score:
-                    best_score = score
-                    best_result = result
-                    
-            except Exception as e:
-                self.logger.warning(f"{method} 추출 실패: {str(e)}")
-                continue
-                
-        return best_result
         
     def extract_with_pdfplumber(self, pdf_path: str, options: dict) -> Dict:
         """pdfplumber를 사용한 추출"""
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        include_text = options.get('include_text', False)
         
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages):
@@ -385,10 +897,9 @@ class PDFExtractor:
                 for table in tables:
                     try:
                         table_data = table.extract()
-                        if table_data and len(table_data) >= options.get('min_rows', 2):
-                            df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                            df = self.clean_dataframe(df)
-                            if len(df.columns) >= options.get('min_cols', 2):
+                        if table_data and len(table_data) >= min_rows:
+                            df = self.table_to_dataframe(table_data)
+                            if len(df.columns) >= min_cols:
                                 extracted_data['tables'].append({
                                     'data': df,
                                     'page': page_num + 1,
@@ -398,7 +909,7 @@ class PDFExtractor:
                         self.logger.warning(f"테이블 추출 실패 (페이지 {page_num + 1}): {str(e)}")
                         
                 # 텍스트 추출
-                if options.get('include_text', False):
+                if include_text:
                     text = page.extract_text()
                     if text:
                         extracted_data['text'].append({
@@ -410,7 +921,11 @@ class PDFExtractor:
         
     def extract_with_camelot(self, pdf_path: str, options: dict) -> Dict:
         """camelot을 사용한 추출"""
+        import camelot  # OpenCV/ghostscript를 끌어오므로 쓸 때만 import
+        
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
         
         try:
             tables = camelot.read_pdf(pdf_path, pages='all', flavor='lattice')
@@ -419,8 +934,8 @@ class PDFExtractor:
                 df = table.df
                 df = self.clean_dataframe(df)
                 
-                if (len(df) >= options.get('min_rows', 2) and 
-                    len(df.columns) >= options.get('min_cols', 2)):
+                if (len(df) >= min_rows and 
+                    len(df.columns) >= min_cols):
                     extracted_data['tables'].append({
                         'data': df,
                         'page': table.page,
@@ -435,7 +950,14 @@ class PDFExtractor:
         
     def extract_with_tabula(self, pdf_path: str, options: dict) -> Dict:
         """tabula를 사용한 추출"""
+        import tabula  # JVM 연동 모듈이라 쓸 때만 import
+        
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        if not java_available():
+            self.logger.error("tabula를 실행하려면 Java가 필요합니다. Java를 설치하거나 다른 추출 방법을 선택하세요.")
+            return extracted_data
         
         try:
             tables = tabula.read_pdf(pdf_path, pages='all', multiple_tables=True)
@@ -444,8 +966,8 @@ class PDFExtractor:
                 if isinstance(df, pd.DataFrame):
                     df = self.clean_dataframe(df)
                     
-                    if (len(df) >= options.get('min_rows', 2) and 
-                        len(df.columns) >= options.get('min_cols', 2)):
+                    if (len(df) >= min_rows and 
+                        len(df.columns) >= min_cols):
                         extracted_data['tables'].append({
                             'data': df,
                             'page': i + 1,  # 정확한 페이지 번호는 별도 계산 필요
@@ -460,6 +982,9 @@ class PDFExtractor:
     def extract_with_pymupdf(self, pdf_path: str, options: dict) -> Dict:
         """PyMuPDF를 사용한 추출"""
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        include_text = options.get('include_text', False)
         
         try:
             doc = fitz.open(pdf_path)
@@ -472,10 +997,9 @@ class PDFExtractor:
                 for table in tables:
                     try:
                         table_data = table.extract()
-                        if table_data and len(table_data) >= options.get('min_rows', 2):
-                            df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                            df = self.clean_dataframe(df)
-                            if len(df.columns) >= options.get('min_cols', 2):
+                        if table_data and len(table_data) >= min_rows:
+                            df = self.table_to_dataframe(table_data)
+                            if len(df.columns) >= min_cols:
                                 extracted_data['tables'].append({
                                     'data': df,
                                     'page': page_num + 1,
@@ -485,7 +1009,7 @@ class PDFExtractor:
                         self.logger.warning(f"PyMuPDF 테이블 추출 실패: {str(e)}")
                         
                 # 텍스트 추출
-                if options.get('include_text', False):
+                if include_text:
                     text = page.get_text()
                     if text:
                         extracted_data['text'].append({
@@ -501,11 +1025,17 @@ class PDFExtractor:
         return extracted_data
         
     def extract_with_pymupdf_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
-        """PyMuPDF를 사용한 페이지 범위 추출"""
+        """PyMuPDF를 사용한 페이지 범위 추출 (옵션 pymupdf_strategy: find_tables 전략, 기본 'lines')"""
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        include_text = options.get('include_text', False)
+        strategy = options.get('pymupdf_strategy', 'lines')
+        method_name = 'pymupdf' if strategy == 'lines' else f'pymupdf_{strategy}'
         
         try:
-            doc = fitz.open(pdf_path)
+            shared_doc = self._session_doc(pdf_path)
+            doc = shared_doc if shared_doc is not None else fitz.open(pdf_path)
             
             for page_num in range(start_page, min(end_page, len(doc))):
                 try:
@@ -513,22 +1043,17 @@ class PDFExtractor:
                     
                     # 테이블 찾기 시도
                     try:
-                        tables = page.find_tables()
+                        tables = page.find_tables(strategy=strategy)
                         for table in tables:
                             try:
                                 table_data = table.extract()
-                                if table_data and len(table_data) >= options.get('min_rows', 2):
-                                    if len(table_data) > 1:
-                                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                                    else:
-                                        df = pd.DataFrame(table_data)
-                                    
-                                    df = self.clean_dataframe(df)
-                                    if len(df.columns) >= options.get('min_cols', 2):
+                                if table_data and len(table_data) >= min_rows:
+                                    df = self.table_to_dataframe(table_data)
+                                    if len(df.columns) >= min_cols:
                                         extracted_data['tables'].append({
                                             'data': df,
                                             'page': page_num + 1,
-                                            'method': 'pymupdf'
+                                            'method': method_name
                                         })
                             except Exception as e:
                                 self.logger.warning(f"PyMuPDF 테이블 추출 실패 (페이지 {page_num + 1}): {str(e)}")
@@ -537,7 +1062,7 @@ class PDFExtractor:
                         pass
                         
                     # 텍스트 추출
-                    if options.get('include_text', False):
+                    if include_text:
                         try:
                             text = page.get_text()
                             if text and text.strip():
@@ -552,16 +1077,28 @@ class PDFExtractor:
                     self.logger.warning(f"페이지 {page_num + 1} 처리 실패: {str(e)}")
                     continue
                     
-            doc.close()
+            if doc is not shared_doc:
+                doc.close()
             
         except Exception as e:
             self.logger.error(f"PyMuPDF 페이지 범위 추출 실패: {str(e)}")
             
         return extracted_data
         
+    def extract_with_pymupdf_text_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
+        """PyMuPDF find_tables 'text' 전략으로 괘선 없는 테이블 추출 (tabula stream 방식을 프로세스 안에서 대신함)"""
+        return self.extract_with_pymupdf_range(pdf_path, dict(options, pymupdf_strategy='text'), start_page, end_page)
+        
     def extract_with_camelot_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
-        """camelot을 사용한 페이지 범위 추출"""
+        """camelot을 사용한 페이지 범위 추출 (옵션 camelot_flavor='lattice_fast'면 PyMuPDF 선 정보로 직접 처리)"""
+        if options.get('camelot_flavor', 'lattice') == 'lattice_fast':
+            return self._lattice_fast_range(pdf_path, options, start_page, end_page)
+        
+        import camelot  # OpenCV/ghostscript를 끌어오므로 쓸 때만 import
+        
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
         
         try:
             # 페이지 범위 문자열 생성
@@ -574,8 +1111,8 @@ class PDFExtractor:
                     df = table.df
                     df = self.clean_dataframe(df)
                     
-                    if (len(df) >= options.get('min_rows', 2) and 
-                        len(df.columns) >= options.get('min_cols', 2)):
+                    if (len(df) >= min_rows and 
+                        len(df.columns) >= min_cols):
                         extracted_data['tables'].append({
                             'data': df,
                             'page': table.page,
@@ -590,9 +1127,87 @@ class PDFExtractor:
             
         return extracted_data
         
+    def _lattice_fast_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
+        """camelot lattice 대체: 이미 열린 PyMuPDF 문서의 선으로 격자를 만들고 단어를 셀에 배치
+        
+        Ghostscript 렌더링과 pdfminer 재파싱 없이 처리 (페이지당 괘선 격자 1개로 간주)
+        """
+        extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        
+        try:
+            shared_doc = self._session_doc(pdf_path)
+            doc = shared_doc if shared_doc is not None else fitz.open(pdf_path)
+            try:
+                for page_num in range(start_page, min(end_page, len(doc))):
+                    try:
+                        table_data = self._lattice_grid_table(doc.load_page(page_num))
+                        if table_data and len(table_data) >= min_rows:
+                            df = self.table_to_dataframe(table_data)
+                            if len(df.columns) >= min_cols:
+                                extracted_data['tables'].append({
+                                    'data': df,
+                                    'page': page_num + 1,
+                                    'method': 'camelot'
+                                })
+                    except Exception as e:
+                        self.logger.warning(f"격자 테이블 추출 실패 (페이지 {page_num + 1}): {str(e)}")
+            finally:
+                if doc is not shared_doc:
+                    doc.close()
+                        
+        except Exception as e:
+            self.logger.error(f"격자 테이블 페이지 범위 추출 실패: {str(e)}")
+            
+        return extracted_data
+        
+    def _lattice_grid_table(self, page: fitz.Page) -> Optional[List[List[str]]]:
+        """페이지의 가로/세로 선을 좌표별로 묶어 격자를 만들고 단어를 중심점 기준으로 셀에 배치 (격자가 없으면 None)"""
+        tol = LATTICE_SNAP_TOLERANCE
+        row_lines, col_lines = [], []
+        for drawing in page.get_drawings():
+            for item in drawing['items']:
+                if item[0] == 'l':
+                    p1, p2 = item[1], item[2]
+                    if abs(p1.y - p2.y) <= tol:
+                        row_lines.append((p1.y + p2.y) / 2)
+                    elif abs(p1.x - p2.x) <= tol:
+                        col_lines.append((p1.x + p2.x) / 2)
+                elif item[0] == 're':
+                    rect = item[1]
+                    if rect.height <= tol:  # 얇은 사각형으로 그린 선
+                        row_lines.append((rect.y0 + rect.y1) / 2)
+                    elif rect.width <= tol:
+                        col_lines.append((rect.x0 + rect.x1) / 2)
+                    else:
+                        row_lines += [rect.y0, rect.y1]
+                        col_lines += [rect.x0, rect.x1]
+        
+        rows = _snap_coordinates(row_lines, tol)
+        cols = _snap_coordinates(col_lines, tol)
+        if len(rows) < 2 or len(cols) < 2:
+            return None
+        
+        cells = [[[] for _ in range(len(cols) - 1)] for _ in range(len(rows) - 1)]
+        for x0, y0, x1, y1, word, *_ in page.get_text('words'):
+            row = int(np.searchsorted(rows, (y0 + y1) / 2)) - 1
+            col = int(np.searchsorted(cols, (x0 + x1) / 2)) - 1
+            if 0 <= row < len(rows) - 1 and 0 <= col < len(cols) - 1:
+                cells[row][col].append(word)
+        
+        return [[' '.join(words) for words in row] for row in cells]
+        
     def extract_with_tabula_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
         """tabula를 사용한 페이지 범위 추출"""
+        import tabula  # JVM 연동 모듈이라 쓸 때만 import
+        
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
+        min_rows = options.get('min_rows', 2)
+        min_cols = options.get('min_cols', 2)
+        if not java_available():
+            self.logger.error("tabula를 실행하려면 Java가 필요합니다. Java를 설치하거나 다른 추출 방법을 선택하세요.")
+            return extracted_data
         
         try:
             # 페이지 범위 문자열 생성
@@ -605,8 +1220,8 @@ class PDFExtractor:
                     if isinstance(df, pd.DataFrame):
                         df = self.clean_dataframe(df)
                         
-                        if (len(df) >= options.get('min_rows', 2) and 
-                            len(df.columns) >= options.get('min_cols', 2)):
+                        if (len(df) >= min_rows and 
+                            len(df.columns) >= min_cols):
                             extracted_data['tables'].append({
                                 'data': df,
                                 'page': start_page + i + 1,  # 근사치
@@ -620,72 +1235,142 @@ class PDFExtractor:
             
         return extracted_data
         
+    def get_easyocr_reader(self, gpu: Optional[bool] = None):
+        """EasyOCR 리더 (최초 호출 시 생성하고 빈 이미지로 한 번 실행해 예열, gpu=None이면 CUDA 사용 가능 여부로 결정)"""
+        import easyocr  # torch 로딩이 무거워 쓸 때만 import
+        
+        if self._easyocr_reader is None:
+            if gpu is None:
+                import torch  # easyocr가 이미 불러온 모듈
+                gpu = torch.cuda.is_available()
+            reader = easyocr.Reader(['ko', 'en'], gpu=gpu, cudnn_benchmark=gpu)
+            reader.readtext(np.zeros((600, 800, 3), dtype=np.uint8))
+            self._easyocr_reader = reader
+        return self._easyocr_reader
+        
     def extract_with_ocr_range(self, pdf_path: str, options: dict, start_page: int, end_page: int) -> Dict:
         """OCR을 사용한 페이지 범위 추출 (제한적 사용)"""
         extracted_data = {'tables': [], 'text': [], 'metadata': {}}
         
         try:
-            doc = fitz.open(pdf_path)
+            shared_doc = self._session_doc(pdf_path)
+            doc = shared_doc if shared_doc is not None else fitz.open(pdf_path)
+            page_count = len(doc)
             ocr_engine = options.get('ocr_engine', 'tesseract')
+            page_nums = range(start_page, min(end_page, page_count))
+            ocr_dpi = options.get('ocr_dpi', OCR_DPI)
             
-            # EasyOCR 초기화 (필요한 경우)
-            reader = None
-            if ocr_engine == 'easyocr':
-                reader = easyocr.Reader(['ko', 'en'])
-                
-            for page_num in range(start_page, min(end_page, len(doc))):
-                try:
-                    page = doc.load_page(page_num)
-                    
-                    # 페이지를 이미지로 변환 (해상도 제한으로 메모리 절약)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5))  # 1.5배 확대로 제한
-                    img_data = pix.tobytes("png")
-                    
-                    # 임시 파일로 저장
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                        tmp_file.write(img_data)
-                        tmp_path = tmp_file.name
-                        
-                    try:
-                        # OCR 수행
-                        if ocr_engine == 'tesseract':
-                            text = pytesseract.image_to_string(
-                                tmp_path, lang='kor+eng', config='--psm 6'
-                            )
-                        else:  # easyocr
-                            results = reader.readtext(tmp_path)
-                            text = '\n'.join([result[1] for result in results])
-                            
-                        if text.strip():
-                            # 테이블 구조 감지 시도
-                            tables = self.detect_table_structure(text, page_num + 1)
-                            extracted_data['tables'].extend(tables)
-                            
-                            # 텍스트 저장
-                            if options.get('include_text', False):
-                                extracted_data['text'].append({
-                                    'content': text,
-                                    'page': page_num + 1,
-                                    'method': f'ocr_{ocr_engine}'
-                                })
-                                
-                    finally:
-                        # 임시 파일 삭제
-                        try:
-                            os.unlink(tmp_path)
-                        except:
-                            pass
+            try:
+                if ocr_engine == 'easyocr':
+                    # 범위 내 페이지를 한 번에 인식 (검출 모델을 페이지마다 따로 돌리지 않음)
+                    page_texts = self._easyocr_pages(doc, page_nums, options.get('gpu'), ocr_dpi)
+                else:
+                    page_texts = self._tesseract_pages(doc, page_nums, ocr_dpi)
+            finally:
+                if doc is not shared_doc:
+                    doc.close()
                         
-                except Exception as e:
-                    self.logger.warning(f"OCR 처리 실패 (페이지 {page_num + 1}): {str(e)}")
-                    continue
+            for page_num, text in page_texts:
+                if text.strip():
+                    # 테이블 구조 감지 시도
+                    tables = self.detect_table_structure(text, page_num + 1)
+                    extracted_data['tables'].extend(tables)
                     
-            doc.close()
+                    # 텍스트 저장
+                    if options.get('include_text', False):
+                        extracted_data['text'].append({
+                            'content': text,
+                            'page': page_num + 1,
+                            'method': f'ocr_{ocr_engine}'
+                        })
             
         except Exception as e:
             self.logger.error(f"OCR 페이지 범위 추출 실패: {str(e)}")
             
         return extracted_data
+        
+    def _render_ocr_pixmap(self, doc: fitz.Document, page_num: int, dpi: int) -> fitz.Pixmap:
+        """OCR용 페이지 이미지 (OCR 엔진이 어차피 흑백으로 변환하므로 처음부터 흑백 1채널로 렌더링)"""
+        zoom = dpi / 72
+        page = doc.load_page(page_num)
+        return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+        
+    def _tesseract_pages(self, doc: fitz.Document, page_nums, dpi: int) -> List[Tuple[int, str]]:
+        """Tesseract로 범위 내 페이지를 OCR → [(페이지 번호, 텍스트)]
+        
+        페이지 이미지 경로 목록 파일을 넘겨 tesseract를 한 번만 실행 (초기화 비용 1회),
+        결과는 페이지 구분 문자(\\f)로 나눔
+        """
+        import pytesseract  # 지연 import
+        
+        with tempfile.TemporaryDirectory(prefix='pdf_ocr_') as tmp_dir:
+            image_paths = []
+            rendered = []
+            for page_num in page_nums:
+                try:
+                    # 페이지를 이미지로 변환
+                    pix = self._render_ocr_pixmap(doc, page_num, dpi)
+                    image_path = os.path.join(tmp_dir, f"page_{page_num + 1}.png")
+                    pix.save(image_path)
+                    image_paths.append(image_path)
+                    rendered.append(page_num)
+                except Exception as e:
+                    self.logger.warning(f"OCR 처리 실패 (페이지 {page_num + 1}): {str(e)}")
+                    
+            if not image_paths:
+                return []
+                
+            list_path = os.path.join(tmp_dir, 'pages.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(image_paths) + '\n')
+                
+            try:
+                output = pytesseract.image_to_string(list_path, lang='kor+eng', config='--psm 6')
+                texts = output.split('\f')[:len(rendered)]
+                if len(texts) == len(rendered):
+                    return list(zip(rendered, texts))
+                self.logger.warning("Tesseract 일괄 OCR 결과의 페이지 수가 맞지 않아 페이지별로 다시 처리합니다.")
+            except Exception as e:
+                self.logger.warning(f"Tesseract 일괄 OCR 실패, 페이지별로 다시 처리합니다: {str(e)}")
+            
+            # 일괄 처리가 실패하면 페이지별로 실행
+            page_texts = []
+            for page_num, image_path in zip(rendered, image_paths):
+                try:
+                    text = pytesseract.image_to_string(image_path, lang='kor+eng', config='--psm 6')
+                    page_texts.append((page_num, text))
+                except Exception as e:
+                    self.logger.warning(f"OCR 처리 실패 (페이지 {page_num + 1}): {str(e)}")
+            return page_texts
+        
+    def _easyocr_pages(self, doc: fitz.Document, page_nums, gpu: Optional[bool], dpi: int) -> List[Tuple[int, str]]:
+        """EasyOCR readtext_batched로 여러 페이지를 한 번에 OCR → [(페이지 번호, 텍스트)]"""
+        images = []
+        rendered = []
+        for page_num in page_nums:
+            try:
+                # 임시 파일 없이 픽셀 버퍼를 바로 흑백 배열로 사용
+                pix = self._render_ocr_pixmap(doc, page_num, dpi)
+                images.append(np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width))
+                rendered.append(page_num)
+            except Exception as e:
+                self.logger.warning(f"OCR 처리 실패 (페이지 {page_num + 1}): {str(e)}")
+                
+        if not images:
+            return []
+            
+        # 일괄 인식은 모든 이미지를 같은 크기로 맞추므로 가장 큰 페이지 크기를 사용
+        # (크기가 같은 페이지는 확대/왜곡 없이 렌더링 해상도 그대로 인식)
+        reader = self.get_easyocr_reader(gpu)
+        results = reader.readtext_batched(
+            images,
+            n_width=max(image.shape[1] for image in images),
+            n_height=max(image.shape[0] for image in images)
+        )
+        return [
+            (page_num, '\n'.join(result[1] for result in page_results))
+            for page_num, page_results in zip(rendered, results)
+        ]
 
     def detect_table_structure(self, text: str, page_num: int) -> List[Dict]:
         """텍스트에서 테이블 구조 감지 (안정성 개선)"""
@@ -698,11 +1383,8 @@ class PDFExtractor:
             for line in lines:
                 # 탭이나 다중 공백으로 분리된 데이터 찾기
                 if '\t' in line or '  ' in line:
-                    # 분리 시도
-                    if '\t' in line:
-                        cells = [cell.strip() for cell in line.split('\t') if cell.strip()]
-                    else:
-                        cells = [cell.strip() for cell in line.split('  ') if cell.strip()]
+                    # 분리 시도 (앞뒤 공백은 줄에서 한 번만 제거, 구분자가 셀 주변 공백까지 흡수)
+                    cells = [cell for cell in _CELL_SEPARATOR.split(line.strip()) if cell]
                         
                     if len(cells) >= 2:  # 최소 2개 열
                         potential_table_lines.append(cells)
@@ -716,22 +1398,16 @@ class PDFExtractor:
                 
                 if len(filtered_lines) >= 2:
                     try:
-                        # DataFrame 생성 (안전하게)
-                        max_len = max(len(line) for line in filtered_lines)
-                        normalized_lines = []
+                        # DataFrame 생성 (안전하게) - 가장 긴 줄은 항상 남으므로 열 수는 max_cols
+                        max_len = max_cols
                         
-                        for line in filtered_lines:
-                            # 행 길이 정규화
-                            while len(line) < max_len:
-                                line.append('')
-                            normalized_lines.append(line[:max_len])
-                        
-                        if len(normalized_lines) > 1:
-                            df = pd.DataFrame(normalized_lines[1:], columns=normalized_lines[0])
-                        else:
-                            df = pd.DataFrame(normalized_lines)
-                            
-                        df = self.clean_dataframe(df)
+                        # 2차원 object 배열에 바로 채워 DataFrame 생성 (모자란 칸은 빈 셀,
+                        # 셀은 분리할 때 이미 공백 제거가 끝났으므로 table_to_dataframe의 정리 단계는 생략)
+                        grid = np.full((len(filtered_lines), max_len), None, dtype=object)
+                        for i, line in enumerate(filtered_lines):
+                            grid[i, :len(line)] = line
+                        header = filtered_lines[0] + [''] * (max_len - len(filtered_lines[0]))
+                        df = self.clean_dataframe(pd.DataFrame(grid[1:], columns=header), stripped=True)
                         
                         if not df.empty and len(df.columns) >= 2:
                             tables.append({
@@ -747,20 +1423,40 @@ class PDFExtractor:
             
         return tables
         
-    def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """DataFrame 정리 (안전한 처리)"""
+    def table_to_dataframe(self, table_data: List[List]) -> pd.DataFrame:
+        """추출된 표(행 리스트, 첫 행은 헤더)를 정리된 DataFrame으로 변환
+        
+        셀 공백 제거와 빈 셀 처리를 리스트 단계에서 한 번에 끝내고 from_records로 생성
+        """
+        rows = [
+            [str(cell).strip() or None if cell is not None else None for cell in row]
+            for row in table_data
+        ]
+        if len(rows) > 1:
+            df = pd.DataFrame.from_records(rows[1:], columns=table_data[0])
+        else:
+            df = pd.DataFrame.from_records(rows)
+        return self.clean_dataframe(df, stripped=True)
+        
+    def clean_dataframe(self, df: pd.DataFrame, stripped: bool = False) -> pd.DataFrame:
+        """DataFrame 정리 (안전한 처리)
+        
+        stripped: 셀 공백 제거와 빈 셀 처리가 이미 끝난 경우 (table_to_dataframe)
+        
+        입력 DataFrame은 수정하지 않음. 빈 행/열을 거른 새 DataFrame에서 isetitem으로 열 객체만 교체하고
+        기존 열의 배열에는 쓰지 않으므로 따로 복사하지 않음
+        """
         try:
-            # 빈 행/열 제거
-            df = df.dropna(how='all').dropna(axis=1, how='all')
+            # 빈 행/열 제거 (결측 여부를 한 번만 계산해 행·열 마스크를 함께 구함, 결과는 새 DataFrame)
+            missing = df.isna().to_numpy()
+            df = df.iloc[~missing.all(axis=1), ~missing.all(axis=0)]
             
-            # 공백 제거 (pandas 2.1.0+ 호환)
-            if hasattr(df, 'map'):
-                df = df.map(lambda x: str(x).strip() if pd.notna(x) else x)
-            else:
-                df = df.applymap(lambda x: str(x).strip() if pd.notna(x) else x)
-            
-            # 빈 문자열을 NaN으로 변경
-            df = df.replace('', pd.NA)
+            if not stripped:
+                # 공백 제거 (셀마다 파이썬 함수를 부르지 않고 열 단위 문자열 연산으로 처리, 빈 값은 그대로)
+                # 같은 열 처리에서 빈 문자열도 NA로 바꿔 DataFrame 전체를 다시 훑지 않음
+                for i, (_, series) in enumerate(list(df.items())):
+                    col = series.astype(str).str.strip()
+                    df.isetitem(i, series.where(series.isna(), col.mask(col == '', pd.NA)))
             
             # 데이터프레임이 너무 크면 제한
             if len(df) > 10000:
@@ -775,95 +1471,19 @@ class PDFExtractor:
         
     def save_to_excel(self, extracted_data: Dict, output_path: str, options: dict):
         """추출된 데이터를 Excel 파일로 저장 (안정성 개선)"""
+        writer = ExcelTableWriter(output_path, options, self.logger)
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                
-                if options.get('separate_sheets', False):
-                    # 페이지별 시트 분리
-                    page_tables = {}
-                    for table_info in extracted_data['tables']:
-                        page = table_info['page']
-                        if page not in page_tables:
-                            page_tables[page] = []
-                        page_tables[page].append(table_info)
-                        
-                    for page, tables in page_tables.items():
-                        sheet_name = f"Page_{page}"
-                        start_row = 0
-                        
-                        for i, table_info in enumerate(tables):
-                            try:
-                                df = table_info['data']
-                                if isinstance(df, pd.DataFrame) and not df.empty:
-                                    # 시트 이름 길이 제한 (Excel 제한사항)
-                                    if len(sheet_name) > 31:
-                                        sheet_name = sheet_name[:31]
-                                    
-                                    df.to_excel(writer, sheet_name=sheet_name, 
-                                              startrow=start_row, index=False)
-                                    start_row += len(df) + 2  # 2행 간격
-                            except Exception as e:
-                                self.logger.warning(f"테이블 저장 실패 (페이지 {page}): {str(e)}")
-                                
-                else:
-                    # 모든 테이블을 하나의 시트에
-                    if extracted_data['tables']:
-                        start_row = 0
-                        tables_saved = 0
-                        
-                        for table_info in extracted_data['tables']:
-                            try:
-                                df = table_info['data']
-                                if isinstance(df, pd.DataFrame) and not df.empty:
-                                    # 첫 번째 테이블에서 시트 생성
-                                    sheet_name = "Tables"
-                                    
-                                    # 메타데이터 행 추가
-                                    meta_data = [f"페이지 {table_info['page']} - {table_info['method']}"]
-                                    meta_df = pd.DataFrame([meta_data])
-                                    meta_df.to_excel(writer, sheet_name=sheet_name, 
-                                                   startrow=start_row, index=False, header=False)
-                                    start_row += 1
-                                    
-                                    # 테이블 데이터 저장
-                                    df.to_excel(writer, sheet_name=sheet_name, 
-                                              startrow=start_row, index=False)
-                                    start_row += len(df) + 2
-                                    tables_saved += 1
-                                    
-                            except Exception as e:
-                                self.logger.warning(f"테이블 저장 실패: {str(e)}")
-                                
-                        self.logger.info(f"{tables_saved}개 테이블이 저장되었습니다.")
-                        
-                # 텍스트 데이터 저장
-                if extracted_data['text'] and options.get('include_text', False):
-                    try:
-                        text_data = []
-                        for text_info in extracted_data['text']:
-                            text_data.append({
-                                'Page': text_info['page'],
-                                'Content': text_info['content'][:32000]  # Excel 셀 크기 제한
-                            })
-                            
-                        if text_data:
-                            text_df = pd.DataFrame(text_data)
-                            text_df.to_excel(writer, sheet_name="Text", index=False)
-                            self.logger.info(f"{len(text_data)}개 텍스트 블록이 저장되었습니다.")
-                    except Exception as e:
-                        self.logger.warning(f"텍스트 저장 실패: {str(e)}")
-                        
+            writer.write_tables(extracted_data['tables'])
+            writer.write_text(extracted_data['text'])
+            writer.close()
         except Exception as e:
             self.logger.error(f"Excel 파일 저장 실패: {str(e)}")
+            writer.abort()
             raise
 
     def extract_tables(self, pdf_path: str, output_directory: str, method: str = "pdfplumber", password: str = None) -> tuple:
         """간소화된 GUI용 테이블 추출 메서드"""
         try:
-            # 암호 보호된 PDF 체크
-            if password is None and self.is_password_protected(pdf_path):
-                return False, "PDF 파일이 암호로 보호되어 있습니다."
-            
             # 기본 추출 옵션 설정
             options = {
                 'method': method,
@@ -875,23 +1495,28 @@ class PDFExtractor:
                 'batch_size': 50
             }
             
-            # 암호가 있는 경우 PDF 열기 테스트
-            if password:
-                try:
-                    doc = fitz.open(pdf_path)
-                    if doc.needsPass:
-                        if not doc.authenticate(password):
-                            return False, "잘못된 암호입니다."
-                    doc.close()
-                except Exception as e:
-                    return False, f"PDF 열기 실패: {str(e)}"
+            # 문서를 한 번만 열어 암호 확인과 추출에 함께 사용
+            pdf_bytes = read_pdf_bytes(pdf_path)
+            try:
+                doc = open_pdf_document(pdf_path, pdf_bytes)
+            except Exception as e:
+                return False, f"PDF 열기 실패: {str(e)}"
             
-            # 실제 추출 수행
-            success = self.extract_to_excel(pdf_path, output_directory, options)
+            try:
+                if self.is_password_protected(doc):
+                    if password is None:
+                        return False, "PDF 파일이 암호로 보호되어 있습니다."
+                    if not self.verify_password(doc, password):
+                        return False, "잘못된 암호입니다."
+                
+                # 실제 추출 수행
+                success = self.extract_to_excel(pdf_path, output_directory, options, password,
+                                                doc=doc, pdf_bytes=pdf_bytes)
+            finally:
+                doc.close()
             
             if success:
-                pdf_name = Path(pdf_path).stem
-                excel_path = os.path.join(output_directory, f"{pdf_name}_extracted.xlsx")
+                excel_path = excel_output_path(pdf_path, output_directory)
                 return True, f"추출 완료: {excel_path}"
             else:
                 return False, "추출에 실패했습니다."
@@ -899,31 +1524,54 @@ class PDFExtractor:
         except Exception as e:
             return False, f"오류 발생: {str(e)}"
     
-    def is_password_protected(self, pdf_path: str) -> bool:
-        """PDF가 암호로 보호되어 있는지 확인"""
+    def is_password_protected(self, pdf: Union[str, fitz.Document]) -> bool:
+        """PDF가 암호로 보호되어 있는지 확인 (경로 또는 이미 연 문서, 문서는 닫지 않음)"""
         try:
-            doc = fitz.open(pdf_path)
-            is_protected = doc.needsPass
-            doc.close()
-            return is_protected
+            if isinstance(pdf, fitz.Document):
+                return pdf.needs_pass
+            with fitz.open(pdf) as doc:
+                return doc.needs_pass
         except Exception:
             return False
     
-    def verify_password(self, pdf_path: str, password: str) -> bool:
-        """PDF 암호 유효성 검증"""
+    def verify_password(self, pdf: Union[str, fitz.Document], password: str) -> bool:
+        """PDF 암호 유효성 검증 (경로 또는 이미 연 문서, 문서를 넘기면 그 문서를 인증한 상태로 둠)"""
         try:
-            doc = fitz.open(pdf_path)
-            if doc.needsPass:
-                is_valid = doc.authenticate(password)
-                doc.close()
-                return is_valid
-            else:
-                doc.close()
-                return True  # 암호가 필요하지 않은 PDF
+            if isinstance(pdf, fitz.Document):
+                return not pdf.needs_pass or bool(pdf.authenticate(password))
+            with fitz.open(pdf) as doc:
+                return not doc.needs_pass or bool(doc.authenticate(password))  # 암호가 필요 없는 PDF는 True
         except Exception as e:
             self.logger.error(f"암호 검증 중 오류: {str(e)}")
             return False
 
+# 페이지 배치 작업 프로세스의 추출기 (_init_batch_worker에서 생성)
+_batch_extractor = None
+
+
+def _init_batch_worker(pdf_path: str, password: Optional[str] = None):
+    """페이지 배치 작업 프로세스 초기화 (추출기와 문서는 프로세스당 한 번만 열어 모든 배치에 재사용)
+    
+    암호 보호된 PDF는 부모 프로세스에서 인증한 상태가 전달되지 않으므로 여기서 다시 인증
+    """
+    global _batch_extractor
+    _batch_extractor = PDFExtractor()
+    _batch_extractor._session_path = pdf_path
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception:
+        return  # 열 수 없으면 각 추출기가 경로로 직접 처리
+    if doc.needs_pass and not (password is not None and doc.authenticate(password)):
+        doc.close()
+        raise ValueError(f"암호 보호된 PDF를 작업 프로세스에서 열 수 없습니다: {pdf_path}")
+    _batch_extractor._doc = doc
+
+
+def _extract_batch_in_worker(pdf_path: str, method: str, options: dict, start_page: int, end_page: int) -> Optional[Dict]:
+    """작업 프로세스에서 배치 1개 추출 (결과 dict만 부모 프로세스로 전달)"""
+    return _batch_extractor._extract_batch(pdf_path, method, options, start_page, end_page)
+
+
 def test_extractor():
     """테스트 함수 (안정성 개선)"""
     extractor = PDFExtractor()
@@ -9,8 +9,26 @@ import os
 import sys
 import time
 import shutil
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+# 작업 프로세스마다 한 번 만드는 추출기
+_extractor = None
+
+
+def _init_worker():
+    """작업 프로세스 초기화 (추출기를 프로세스당 한 번만 생성)"""
+    global _extractor
+    from pdf_extractor import PDFExtractor
+    _extractor = PDFExtractor()
+
+
+def _extract_one(pdf_file: str, output_dir: str, options: dict) -> bool:
+    """작업 프로세스에서 PDF 1개 추출"""
+    return _extractor.extract_to_excel(pdf_file, output_dir, options)
+
+
 def create_test_scenarios():
     """다양한 테스트 시나리오 생성"""
     
@@ -45,9 +63,15 @@ def create_test_scenarios():
     
     return True
 
-def test_scenario_performance():
-    """각 시나리오별 성능 테스트"""
-    from pdf_extractor import PDFExtractor
+def test_scenario_performance(use_cache: bool = False, one_workbook: bool = False, batch_processes: int = 1):
+    """각 시나리오별 성능 테스트 (시나리오 안의 파일들은 프로세스 풀에서 병렬 처리)
+    
+    use_cache: 내용(SHA-256)이 같은 PDF는 한 번만 추출하고 결과 파일을 복사
+    (복사본으로 만든 시나리오에서는 추출 성능이 아니라 복사 속도를 재게 되므로 기본값은 사용 안 함)
+    one_workbook: 파일이 여러 개인 시나리오는 한 프로세스에서 Excel 파일 하나(PDF마다 시트 1개)로 저장
+    batch_processes: 파일 1개의 페이지 배치를 나눠 처리할 작업 프로세스 수 (1이면 사용 안 함)
+    """
+    from pdf_extractor import excel_output_path
     
     scenarios_dir = Path("test_scenarios")
     if not scenarios_dir.exists():
@@ -56,8 +80,9 @@ def test_scenario_performance():
     
     output_dir = Path("output_performance")
     output_dir.mkdir(exist_ok=True)
-    
-    extractor = PDFExtractor()
+    cache_dir = output_dir / ".cache"
+    if use_cache:
+        cache_dir.mkdir(exist_ok=True)
     
     options = {
         'min_rows': 2,
@@ -65,8 +90,11 @@ def test_scenario_performance():
         'separate_sheets': True,
         'include_text': True,
         'max_pages': 500,
-        'batch_size': 5
+        'batch_size': 5,
+        'batch_processes': batch_processes
     }
+    # 파일마다 배치 작업 프로세스를 띄우므로 동시에 처리할 파일 수를 그만큼 줄임
+    file_workers = max(1, (os.cpu_count() or 1) // batch_processes)
     
     results = []
     
@@ -84,20 +112,66 @@ def test_scenario_performance():
         start_time = time.time()
         successful_files = 0
         
-        for pdf_file in pdf_files:
-            try:
-                success = extractor.extract_to_excel(
-                    str(pdf_file), 
-                    str(output_dir), 
-                    options
-                )
-                if success:
+        batch_workbook = one_workbook and len(pdf_files) > 1
+        cached = use_cache and not batch_workbook
+        
+        to_extract = pdf_files
+        if batch_workbook:
+            # 시나리오 전체를 통합 문서 하나로 저장
+            from pdf_extractor import PDFExtractor
+            
+            workbook_path = excel_output_path(scenario_dir, output_dir)
+            file_results = PDFExtractor().extract_batch_to_excel([str(f) for f in pdf_files], str(workbook_path), options)
+            for pdf_file in pdf_files:
+                if file_results.get(str(pdf_file)):
                     successful_files += 1
                     print(f"   ✅ {pdf_file.name}")
                 else:
                     print(f"   ❌ {pdf_file.name}")
-            except Exception as e:
-                print(f"   💥 {pdf_file.name}: {str(e)}")
+            to_extract = []
+        elif cached:
+            # 내용이 같은 파일은 대표 1개만 추출 (이미 캐시에 있으면 추출하지 않음)
+            digests = {pdf_file: hashlib.sha256(pdf_file.read_bytes()).hexdigest() for pdf_file in pdf_files}
+            representatives = {}
+            for pdf_file, digest in digests.items():
+                if not (cache_dir / f"{digest}.xlsx").exists():
+                    representatives.setdefault(digest, pdf_file)
+            to_extract = list(representatives.values())
+        
+        if to_extract:
+            with ProcessPoolExecutor(max_workers=min(len(to_extract), file_workers),
+                                     initializer=_init_worker) as executor:
+                futures = {
+                    executor.submit(_extract_one, str(pdf_file), str(output_dir), options): pdf_file
+                    for pdf_file in to_extract
+                }
+                for future in as_completed(futures):
+                    pdf_file = futures[future]
+                    try:
+                        if future.result():
+                            if cached:
+                                shutil.copy2(excel_output_path(pdf_file, output_dir), cache_dir / f"{digests[pdf_file]}.xlsx")
+                            else:
+                                successful_files += 1
+                                print(f"   ✅ {pdf_file.name}")
+                        else:
+                            print(f"   ❌ {pdf_file.name}")
+                    except Exception as e:
+                        print(f"   💥 {pdf_file.name}: {str(e)}")
+        
+        if cached:
+            # 캐시된 결과를 각 파일의 결과 경로로 복사 (방금 추출한 대표 파일은 이미 결과가 있음)
+            for pdf_file, digest in digests.items():
+                cache_file = cache_dir / f"{digest}.xlsx"
+                if not cache_file.exists():
+                    # 대표 파일은 추출 결과를 이미 출력했으므로 같은 내용의 나머지 파일만 실패로 표시
+                    if pdf_file not in to_extract:
+                        print(f"   ❌ {pdf_file.name} (같은 내용의 대표 파일 추출 실패)")
+                    continue
+                if pdf_file not in to_extract:
+                    shutil.copy2(cache_file, excel_output_path(pdf_file, output_dir))
+                successful_files += 1
+                print(f"   ✅ {pdf_file.name}{'' if pdf_file in to_extract else ' (캐시)'}")
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -140,5 +214,9 @@ if __name__ == "__main__":
             sys.exit(1)
     else:
         print("\n2️⃣ 성능 테스트 실행 중...")
-        test_scenario_performance()
+        batch_processes = next(
+            (int(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--batch-processes=")), 1
+        )
+        test_scenario_performance(use_cache="--cache" in sys.argv, one_workbook="--one-workbook" in sys.argv,
+                                  batch_processes=batch_processes)
         print("\n🎉 성능 테스트 완료!")
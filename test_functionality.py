@@ -12,7 +12,7 @@ from pathlib import Path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
-from pdf_extractor import PDFExtractor
+from pdf_extractor import PDFExtractor, unique_sheet_name
 
 def test_extractor_initialization():
     """PDFExtractor 초기화 테스트"""
@@ -46,8 +46,83 @@ def test_methods_availability(extractor):
         else:
             print(f"❌ {method_name} 메서드 없음")
 
-def test_with_sample_pdf():
-    """샘플 PDF로 실제 추출 테스트"""
+def test_unique_sheet_names():
+    """일괄 저장 시트 이름 중복 처리 테스트 (이름이 겹쳐도 끝나고 모두 달라야 함)"""
+    print("\n" + "=" * 50)
+    print("시트 이름 중복 처리 테스트")
+    print("=" * 50)
+    
+    stems = ['a_3', 'a', 'a', 'a', 'A', 'x' * 40, 'x' * 40, 'a:b']
+    used = set()
+    names = [unique_sheet_name(stem, used) for stem in stems]
+    
+    if len({name.lower() for name in names}) == len(names) and all(len(name) <= 31 for name in names):
+        print(f"✅ 시트 이름 중복 없음: {names}")
+        return True
+    print(f"❌ 시트 이름 중복 또는 길이 초과: {names}")
+    return False
+
+def test_auto_borderless_table(extractor):
+    """괘선 없는 표가 있는 PDF에서 자동 선택 모드가 테이블을 찾는지 테스트"""
+    print("\n" + "=" * 50)
+    print("괘선 없는 표 자동 추출 테스트")
+    print("=" * 50)
+    
+    import tempfile
+    import fitz  # PyMuPDF
+    
+    rows = [["Name", "Qty", "Price"]] + [[f"Item {i}", str(i * 3), f"{i * 1.5:.2f}"] for i in range(1, 9)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "borderless.pdf")
+        doc = fitz.open()
+        page = doc.new_page()
+        for row_index, row in enumerate(rows):
+            for col_index, cell in enumerate(row):
+                page.insert_text((72 + col_index * 150, 100 + row_index * 20), cell, fontsize=11)
+        doc.save(pdf_path)
+        doc.close()
+        
+        page_types = extractor._classify_pages(pdf_path, 0, 1)
+        data = extractor.extract_data_range(pdf_path, '자동 선택', {'min_rows': 2, 'min_cols': 2}, 0, 1)
+    
+    if page_types == ['unruled'] and data['tables']:
+        table = data['tables'][0]
+        print(f"✅ 테이블 {len(data['tables'])}개 추출 ({table['method']}, {table['data'].shape[0]}x{table['data'].shape[1]})")
+        return True
+    print(f"❌ 괘선 없는 표를 찾지 못함 (페이지 유형: {page_types})")
+    return False
+
+def test_batch_processes_with_password(extractor):
+    """암호 보호된 PDF를 batch_processes 작업 프로세스로 추출하는지 테스트 (작업 프로세스에서 암호 인증)"""
+    print("\n" + "=" * 50)
+    print("암호 보호 PDF 배치 작업 프로세스 추출 테스트")
+    print("=" * 50)
+    
+    import tempfile
+    import fitz  # PyMuPDF
+    
+    options = {'method': '자동 선택', 'include_text': True, 'batch_size': 1, 'batch_processes': 2}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "encrypted.pdf")
+        doc = fitz.open()
+        for page_index in range(4):
+            page = doc.new_page()
+            page.insert_text((72, 100), f"Encrypted page {page_index + 1}", fontsize=11)
+        doc.save(pdf_path, encryption=fitz.PDF_ENCRYPT_AES_256, user_pw="secret", owner_pw="owner")
+        doc.close()
+        
+        wrong = extractor.extract_to_excel(pdf_path, tmp_dir, options, password="wrong")
+        ok = extractor.extract_to_excel(pdf_path, tmp_dir, options, password="secret")
+        output_exists = (Path(tmp_dir) / "encrypted_extracted.xlsx").exists()
+    
+    if ok and output_exists and not wrong:
+        print("✅ 작업 프로세스에서 암호 인증 후 추출 성공 (잘못된 암호는 거부)")
+        return True
+    print(f"❌ 추출 결과: 올바른 암호 {ok}, 결과 파일 {output_exists}, 잘못된 암호 {wrong}")
+    return False
+
+def test_with_sample_pdf(extractor):
+    """샘플 PDF로 실제 추출 테스트 (초기화 테스트에서 만든 추출기 재사용)"""
     print("\n" + "=" * 50)
     print("샘플 PDF 추출 테스트")
     print("=" * 50)
@@ -62,8 +137,6 @@ def test_with_sample_pdf():
     print(f"📄 테스트 파일: {sample_pdf.name}")
     
     try:
-        extractor = PDFExtractor()
-        
         # 암호 보호 확인
         is_protected = extractor.is_password_protected(str(sample_pdf))
         print(f"🔒 암호 보호: {'예' if is_protected else '아니오'}")
@@ -103,8 +176,17 @@ def main():
     # 2. 메서드 가용성 테스트
     test_methods_availability(extractor)
     
-    # 3. 샘플 PDF로 실제 테스트
-    test_with_sample_pdf()
+    # 3. 일괄 저장 시트 이름 테스트
+    test_unique_sheet_names()
+    
+    # 4. 괘선 없는 표 자동 추출 테스트
+    test_auto_borderless_table(extractor)
+    
+    # 5. 암호 보호 PDF 배치 작업 프로세스 테스트
+    test_batch_processes_with_password(extractor)
+    
+    # 6. 샘플 PDF로 실제 테스트
+    test_with_sample_pdf(extractor)
     
     print("\n" + "=" * 50)
     print("✅ 기능 테스트 완료")